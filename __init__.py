@@ -1,56 +1,216 @@
 """The Torn City integration."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+from functools import partial
 import logging
-from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .const import DOMAIN, CONF_API_KEY, CONF_THROTTLE_API, DEFAULT_SCAN_INTERVAL
-from .coordinator import TornDataUpdateCoordinator
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .api import TornClient, TornError
+from .catalog import TornItemCatalog
+from .log_archive import TornLogArchive
+from .const import (
+    DOMAIN,
+    CONF_API_KEY,
+    CONF_THROTTLE_API,
+    CONF_TRACING,
+    DATA_KEY_ENTITY_PREFIXES,
+    EVENTS_STORAGE_KEY,
+    EVENTS_STORAGE_VERSION,
+    KEY_PROBE_INTERVAL,
+    NETWORTH_STORAGE_KEY,
+    NETWORTH_STORAGE_VERSION,
+    get_enabled_endpoints,
+    get_unserved_data_keys,
+)
+from .coordinator import TornDataHub
+from .household import TornHousehold
+from .long_term_stats import TornStatisticsImporter
+from .services import async_setup_services
+from .throttle import TornAdaptiveThrottle
+from .tracing import TornTracer
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SELECT]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Torn City from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Create the data update coordinator
-    session = async_get_clientsession(hass)
-    coordinator = TornDataUpdateCoordinator(
+    # Item catalog is shared by all entries and loaded from disk once
+    if (catalog := hass.data[DOMAIN].get("catalog")) is None:
+        catalog = hass.data[DOMAIN]["catalog"] = TornItemCatalog(hass)
+    await catalog.async_load()
+
+    # Request rate is adapted per API key, across all entries using it
+    throttles: dict[str, TornAdaptiveThrottle] = hass.data[DOMAIN].setdefault("throttles", {})
+    if (throttle := throttles.get(entry.data[CONF_API_KEY])) is None:
+        throttle = throttles[entry.data[CONF_API_KEY]] = TornAdaptiveThrottle()
+
+    # Create the data hub with one update coordinator per cache cadence
+    client = TornClient(async_get_clientsession(hass), entry.data[CONF_API_KEY])
+    client.rate_limiter = throttle.async_acquire
+    client.request_budget = throttle.has_budget
+    client.add_request_hook(throttle.record)
+
+    # Skip endpoints the key's access level cannot read
+    unserved_data_keys = await _async_get_unserved_data_keys(client, entry)
+    disabled_data_keys = _async_get_unused_data_keys(hass, entry) | (unserved_data_keys or set())
+
+    # Log archive is shared by all entries and opened on first use
+    log_archive = None
+    if any(ep["key"] == "log" for ep in get_enabled_endpoints(entry.options, disabled_data_keys)):
+        if (log_archive := hass.data[DOMAIN].get("log_archive")) is None:
+            log_archive = hass.data[DOMAIN]["log_archive"] = TornLogArchive(hass)
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, partial(_async_close_log_archive, hass))
+        await log_archive.async_open()
+
+    # Trace file is shared by all entries and opened on first use
+    tracer = None
+    if entry.options.get(CONF_TRACING, False):
+        if (tracer := hass.data[DOMAIN].get("tracer")) is None:
+            tracer = hass.data[DOMAIN]["tracer"] = TornTracer(hass)
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, partial(_async_stop_tracer, hass))
+        await tracer.async_start()
+
+    # Household totals are shared by all entries
+    if (household := hass.data[DOMAIN].get("household")) is None:
+        household = hass.data[DOMAIN]["household"] = TornHousehold()
+    entry.async_on_unload(partial(household.async_remove_entry, entry.entry_id))
+
+    # Market prices are the same for every account, so one importer serves all entries
+    if (market_statistics := hass.data[DOMAIN].get("market_statistics")) is None:
+        market_statistics = hass.data[DOMAIN]["market_statistics"] = TornStatisticsImporter(hass)
+
+    hub = TornDataHub(
         hass,
-        session,
-        entry.data[CONF_API_KEY],
-        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        client,
         entry.data.get(CONF_THROTTLE_API, False),
         entry.options,  # Pass options for endpoint selection
+        catalog,
+        entry.entry_id,
+        disabled_data_keys,
+        throttle,
+        log_archive,
+        tracer,
+        household,
+        market_statistics,
     )
+    entry.async_on_unload(throttle.async_add_listener(hub.async_throttle_changed))
+    entry.async_on_unload(catalog.async_add_listener(hub.async_catalog_changed))
 
     # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    await hub.async_config_entry_first_refresh()
 
-    # Store coordinator and API key for use by platforms
+    # Store hub and API key for use by platforms
     hass.data[DOMAIN][entry.entry_id] = {
         CONF_API_KEY: entry.data[CONF_API_KEY],
-        "session": session,
-        "coordinator": coordinator,
+        "client": client,
+        "hub": hub,
+        "unserved_data_keys": unserved_data_keys,
     }
 
+    # Access can change when the key is edited on the Torn website
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            partial(_async_reprobe_key, hass, entry),
+            timedelta(seconds=KEY_PROBE_INTERVAL),
+        )
+    )
+
     # Forward the setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Register integration services (shared by all entries)
+    async_setup_services(hass)
+
     # Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+async def _async_get_unserved_data_keys(client: TornClient, entry: ConfigEntry) -> set[str] | None:
+    """Return enabled data keys the API key may not read, or None if the probe failed."""
+    try:
+        selections = await client.async_get_selections()
+    except TornError as err:
+        _LOGGER.warning(f"Could not probe API key access, requesting all enabled endpoints: {err}")
+        return None
+
+    unserved = get_unserved_data_keys(selections, get_enabled_endpoints(entry.options))
+    if unserved:
+        _LOGGER.info(f"API key cannot read {', '.join(sorted(unserved))}, skipping those endpoints")
+    return unserved
+
+
+async def _async_reprobe_key(hass: HomeAssistant, entry: ConfigEntry, _now: datetime) -> None:
+    """Reload the entry when the key's access changed since setup."""
+    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is None:
+        return
+
+    unserved = await _async_get_unserved_data_keys(entry_data["client"], entry)
+    if unserved is None or unserved == (entry_data["unserved_data_keys"] or set()):
+        return
+
+    _LOGGER.info("API key access changed, reloading")
+    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
+def _async_get_unused_data_keys(hass: HomeAssistant, entry: ConfigEntry) -> set[str]:
+    """Return data keys whose consuming entities are all disabled.
+
+    Enabling one of those entities again reloads the entry, which brings the
+    endpoint back.
+    """
+    registry = er.async_get(hass)
+    registered = er.async_entries_for_config_entry(registry, entry.entry_id)
+    unused: set[str] = set()
+
+    for data_key, prefix in DATA_KEY_ENTITY_PREFIXES.items():
+        consumers = [
+            entity for entity in registered
+            if entity.unique_id.startswith(f"{entry.entry_id}_{prefix}")
+        ]
+        if consumers and all(entity.disabled_by is not None for entity in consumers):
+            _LOGGER.debug(f"Skipping {data_key}: all consuming entities are disabled")
+            unused.add(data_key)
+
+    return unused
+
+
+def _loaded_hubs(hass: HomeAssistant) -> list[TornDataHub]:
+    """Return the data hubs of all loaded entries."""
+    return [
+        entry_data["hub"]
+        for entry_data in hass.data[DOMAIN].values()
+        if isinstance(entry_data, dict) and "hub" in entry_data
+    ]
+
+
+async def _async_close_log_archive(hass: HomeAssistant, _event: Event | None = None) -> None:
+    """Close the shared log archive, if it is open."""
+    if (log_archive := hass.data[DOMAIN].pop("log_archive", None)) is not None:
+        await log_archive.async_close()
+
+
+async def _async_stop_tracer(hass: HomeAssistant, _event: Event | None = None) -> None:
+    """Flush and close the shared trace file, if it is open."""
+    if (tracer := hass.data[DOMAIN].pop("tracer", None)) is not None:
+        await tracer.async_stop()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -61,4 +221,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Shared resources are closed with the last entry that uses them
+        hubs = _loaded_hubs(hass)
+        if not any(hub.log_archive is not None for hub in hubs):
+            await _async_close_log_archive(hass)
+        if not any(hub.tracer is not None for hub in hubs):
+            await _async_stop_tracer(hass)
+
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data persisted for a config entry."""
+    await Store(hass, EVENTS_STORAGE_VERSION, f"{EVENTS_STORAGE_KEY}.{entry.entry_id}").async_remove()
+    await Store(hass, NETWORTH_STORAGE_VERSION, f"{NETWORTH_STORAGE_KEY}.{entry.entry_id}").async_remove()
@@ -0,0 +1,250 @@
+"""Async client for the Torn City API."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+import logging
+from time import monotonic, time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.helpers.json import json_loads
+
+from .const import (
+    API_BASE_URL,
+    API_RATE_LIMIT,
+    API_TIMEOUT,
+    HEDGE_LATENCY_SAMPLES,
+    HEDGE_MIN_SAMPLES,
+    KEY_INFO_PATH,
+)
+from .tracing import span
+
+_LOGGER = logging.getLogger(__name__)
+
+# Torn error codes for keys that cannot be used (incorrect, owner in federal
+# jail, disabled for inactivity, paused by the owner)
+TORN_KEY_ERROR_CODES = {1, 2, 10, 13, 18}
+# Torn error code for too many requests
+TORN_RATE_LIMIT_ERROR_CODE = 5
+
+
+class TornError(Exception):
+    """Base error for Torn API requests."""
+
+
+class TornConnectionError(TornError):
+    """Network failure, timeout or unexpected HTTP status."""
+
+
+class TornApiError(TornError):
+    """Error reported by the Torn API in the response body."""
+
+    def __init__(self, code: int, message: str, path: str) -> None:
+        """Initialize the error with the Torn error code."""
+        super().__init__(f"API error {code}: {message} on {path}")
+        self.code = code
+        self.message = message
+        self.path = path
+
+
+class TornRateLimitError(TornApiError):
+    """Too many requests were made with the key."""
+
+
+class TornKeyError(TornApiError):
+    """The API key is incorrect, paused or disabled."""
+
+
+def api_error_from_payload(error: dict[str, Any], path: str) -> TornApiError:
+    """Return the typed error for an error payload."""
+    code = error.get("code", 0)
+    message = error.get("error", "Unknown error")
+    if code == TORN_RATE_LIMIT_ERROR_CODE:
+        return TornRateLimitError(code, message, path)
+    if code in TORN_KEY_ERROR_CODES:
+        return TornKeyError(code, message, path)
+    return TornApiError(code, message, path)
+
+
+# Called after every request with the label, latency in seconds and error (if any)
+RequestHook = Callable[[str, float, TornError | None], None]
+
+
+class TornClient:
+    """Torn API client bound to one API key.
+
+    Requests go through Home Assistant's shared, keep-alive connection pool;
+    aiohttp negotiates compressed responses. The client keeps per-label
+    latency samples and a per-minute request count, and exposes hooks so
+    callers can observe or pace requests.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        rate_limit: int = API_RATE_LIMIT,
+    ) -> None:
+        """Initialize the client."""
+        self.session = session
+        self.api_key = api_key
+        self.rate_limit = rate_limit
+        # Recent request latencies per label (seconds), used for hedging
+        self.latencies: dict[str, deque[float]] = {}
+        # Timestamps of requests sent in the last minute, counted against the rate budget
+        self._request_times: deque[float] = deque()
+        # Awaited before every request, e.g. to wait for rate budget
+        self.rate_limiter: Callable[[], Awaitable[None]] | None = None
+        # Asked before an extra (hedged) request, e.g. for the shared budget of the key
+        self.request_budget: Callable[[], bool] | None = None
+        self._request_hooks: list[RequestHook] = []
+
+    def add_request_hook(self, hook: RequestHook) -> Callable[[], None]:
+        """Register a hook called after every request; return a remover."""
+        self._request_hooks.append(hook)
+        return lambda: self._request_hooks.remove(hook)
+
+    async def async_get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: float = API_TIMEOUT,
+        label: str | None = None,
+        hedge: bool = False,
+    ) -> dict[str, Any]:
+        """GET an API path, hedging with a second request if the first is slow.
+
+        Hedging is only used when requested, once enough latency samples
+        exist to know the p95, and only while the rate budget allows the
+        extra request.
+        """
+        label = label or path
+        hedge_delay = self.latency_p95(label) if hedge else None
+        if hedge_delay is None:
+            return await self._async_get_once(path, params, timeout, label)
+
+        first = asyncio.create_task(self._async_get_once(path, params, timeout, label))
+        done, _ = await asyncio.wait({first}, timeout=hedge_delay)
+        if done or not self.has_request_budget():
+            return await first
+
+        _LOGGER.debug(f"Hedging {label} after {hedge_delay:.2f}s")
+        pending = {first, asyncio.create_task(self._async_get_once(path, params, timeout, label))}
+        first_error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if (error := task.exception()) is None:
+                        return task.result()
+                    first_error = first_error or error
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _async_get_once(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        timeout: float,
+        label: str,
+    ) -> dict[str, Any]:
+        """Perform a single GET request."""
+        if self.rate_limiter is not None:
+            with span("rate_limit_wait", label):
+                await self.rate_limiter()
+
+        query_params = dict(params or {})
+        headers = {}
+        # API v2 takes the key in a header, which keeps it out of URLs and logs
+        if path.startswith("/v2/"):
+            headers["Authorization"] = f"ApiKey {self.api_key}"
+        else:
+            query_params["key"] = self.api_key
+
+        now = time()
+        self._request_times.append(now)
+        self._trim_request_times(now)
+        started = monotonic()
+        error: TornError | None = None
+        succeeded = False
+        cancelled = False
+        try:
+            with span("http", label):
+                async with self.session.get(
+                    f"{API_BASE_URL}{path}",
+                    params=query_params,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as response:
+                    if response.status != 200:
+                        raise TornConnectionError(f"HTTP {response.status} on {path}")
+                    body = await response.read()
+
+            # Decode straight from the response bytes
+            with span("parse", label):
+                data = json_loads(body)
+
+            if isinstance(data, dict) and "error" in data:
+                raise api_error_from_payload(data["error"], path)
+            succeeded = True
+        except TornError as err:
+            error = err
+            raise
+        except TimeoutError as err:
+            error = TornConnectionError(f"Timeout after {timeout}s on {path}")
+            raise error from err
+        except aiohttp.ClientError as err:
+            error = TornConnectionError(f"Network error on {path}: {err}")
+            raise error from err
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            elapsed = monotonic() - started
+            # A request cancelled after losing a hedge took at least this long; leaving it
+            # out would pull the p95 down and make hedging ever more frequent
+            if succeeded or cancelled:
+                self.latencies.setdefault(label, deque(maxlen=HEDGE_LATENCY_SAMPLES)).append(elapsed)
+            # Cancelled requests report no error to the hooks
+            if succeeded or error is not None:
+                for hook in self._request_hooks:
+                    hook(label, elapsed, error)
+
+        return data
+
+    async def async_get_selections(self) -> dict[str, list[str]]:
+        """Return the selections the key may read, per section."""
+        data = await self.async_get(KEY_INFO_PATH, label="key_info")
+        info = data.get("info", data)
+        return {section: list(names) for section, names in info.get("selections", {}).items()}
+
+    def latency_p95(self, label: str) -> float | None:
+        """Return the p95 request latency for a label."""
+        samples = self.latencies.get(label)
+        if not samples or len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+    def _trim_request_times(self, now: float) -> None:
+        """Drop request timestamps older than the one-minute window."""
+        cutoff = now - 60
+        while self._request_times and self._request_times[0] < cutoff:
+            self._request_times.popleft()
+
+    def has_request_budget(self) -> bool:
+        """Return True if another request fits in the per-minute rate limit.
+
+        The budget hook, when set, decides for all clients sharing the key;
+        otherwise only this client's requests count.
+        """
+        if self.request_budget is not None:
+            return self.request_budget()
+        self._trim_request_times(time())
+        return len(self._request_times) < self.rate_limit
@@ -15,7 +15,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 
 from .const import DOMAIN
-from .coordinator import TornDataUpdateCoordinator
+from .coordinator import TornDataHub, TornDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,11 +26,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Torn City binary sensors from a config entry."""
-    coordinator: TornDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
-        "coordinator"
-    ]
+    hub: TornDataHub = hass.data[DOMAIN][entry.entry_id]["hub"]
+
+    if "refills" not in hub.enabled_data_keys:
+        return
 
     # Create binary sensor entities
+    coordinator = hub.coordinator_for("refills")
     entities: list[BinarySensorEntity] = [
         TornEnergyRefillUsedSensor(coordinator, entry),
         TornNerveRefillUsedSensor(coordinator, entry),
@@ -0,0 +1,118 @@
+"""Persistent item reference catalog for Torn City integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import hashlib
+import json
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import CATALOG_ITEM_FIELDS, CATALOG_STORAGE_KEY, CATALOG_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TornItemCatalog:
+    """Item catalog persisted to disk and indexed by ID and by name.
+
+    The catalog is static reference data shared by all config entries, so a
+    single instance lives in hass.data and is refreshed at most once a day.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the catalog."""
+        self._store: Store[dict[str, Any]] = Store(hass, CATALOG_STORAGE_VERSION, CATALOG_STORAGE_KEY)
+        self._loaded = False
+        self.version: str | None = None
+        self.fetched_at: float = 0
+        self.by_id: dict[int, dict[str, Any]] = {}
+        self.by_name: dict[str, int] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def loaded(self) -> bool:
+        """Return True if the catalog holds any items."""
+        return bool(self.by_id)
+
+    async def async_load(self) -> None:
+        """Load the catalog from disk (only once)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        self.version = stored.get("version")
+        self.fetched_at = stored.get("fetched_at", 0)
+        self._build_index(stored.get("items", {}))
+        _LOGGER.debug(f"Loaded item catalog {self.version} with {len(self.by_id)} items from disk")
+
+    async def async_ingest(self, items: dict[str, Any], fetched_at: float) -> None:
+        """Ingest a fresh items payload, rebuilding the index only when it changed."""
+        if not isinstance(items, dict):
+            return
+
+        projected = {
+            item_id: {field: item.get(field) for field in CATALOG_ITEM_FIELDS}
+            for item_id, item in items.items()
+            if isinstance(item, dict)
+        }
+        version = hashlib.sha1(
+            json.dumps(projected, sort_keys=True).encode()
+        ).hexdigest()[:12]
+
+        self.fetched_at = fetched_at
+        if version != self.version:
+            _LOGGER.info(f"Item catalog changed ({self.version} -> {version}), rebuilding index")
+            self.version = version
+            self._build_index(projected)
+
+        await self._store.async_save(
+            {"version": self.version, "fetched_at": self.fetched_at, "items": projected}
+        )
+
+        # Only one entry fetches the shared catalog; every entry consumes it
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call a listener after every ingest; return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _build_index(self, items: dict[str, Any]) -> None:
+        """Build the ID and name indexes."""
+        by_id: dict[int, dict[str, Any]] = {}
+        by_name: dict[str, int] = {}
+        for item_id, item in items.items():
+            by_id[int(item_id)] = item
+            if name := item.get("name"):
+                by_name[name.lower()] = int(item_id)
+        self.by_id = by_id
+        self.by_name = by_name
+
+    def get(self, item_id: int | str) -> dict[str, Any] | None:
+        """Return an item by ID."""
+        try:
+            return self.by_id.get(int(item_id))
+        except (TypeError, ValueError):
+            return None
+
+    def get_by_name(self, name: str) -> dict[str, Any] | None:
+        """Return an item by name (case-insensitive)."""
+        item_id = self.by_name.get(name.strip().lower())
+        return self.by_id.get(item_id) if item_id is not None else None
+
+    def market_value(self, item: int | str) -> int | None:
+        """Return the market value of an item given its ID or name."""
+        if isinstance(item, int) or (isinstance(item, str) and item.isdigit()):
+            entry = self.get(item)
+        else:
+            entry = self.get_by_name(item)
+        return entry.get("market_value") if entry else None
@@ -4,21 +4,37 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
-
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import (
+    TornClient,
+    TornConnectionError,
+    TornError,
+    TornKeyError,
+    TornRateLimitError,
+)
 from .const import (
     DOMAIN,
     CONF_API_KEY,
     CONF_THROTTLE_API,
-    API_BASE_URL,
-    API_TIMEOUT,
+    CONF_PERSONALSTATS_EXTRA,
+    CONF_COUNTDOWN_RESOLUTION,
+    CONF_HOUSEHOLD,
+    CONF_IDLE_AFTER,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_TRACE_SAMPLE_PERCENT,
+    CONF_TRACING,
+    COUNTDOWN_RESOLUTIONS,
+    DEFAULT_COUNTDOWN_RESOLUTION,
+    DEFAULT_IDLE_AFTER,
+    DEFAULT_TRACE_SAMPLE_PERCENT,
     ENDPOINT_CATEGORIES,
+    get_unserved_categories,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,26 +47,43 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_api_key(api_key: str, session: aiohttp.ClientSession) -> dict[str, Any]:
+async def validate_api_key(client: TornClient) -> dict[str, Any]:
     """Validate the API key by making a test request."""
-    url = f"{API_BASE_URL}/v2/user/basic?key={api_key}"
-
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT)) as response:
-            if response.status == 200:
-                data = await response.json()
-                if "error" in data:
-                    return {"error": data["error"]["error"]}
-                profile = data.get("profile", {})
-                return {"title": profile.get("name", "Torn City"), "user_id": profile.get("id")}
-            return {"error": f"HTTP {response.status}"}
-    except aiohttp.ClientError as err:
+        data = await client.async_get("/v2/user/basic", label="profile")
+    except TornKeyError as err:
+        _LOGGER.error("Invalid Torn API key: %s", err)
+        return {"error": "invalid_api_key"}
+    except TornRateLimitError as err:
+        _LOGGER.error("Torn API rate limit reached: %s", err)
+        return {"error": "rate_limited"}
+    except TornConnectionError as err:
         _LOGGER.error("Error connecting to Torn API: %s", err)
         return {"error": "cannot_connect"}
+    except TornError as err:
+        _LOGGER.error("Torn API error: %s", err)
+        return {"error": "unknown"}
     except Exception as err:
         _LOGGER.exception("Unexpected error: %s", err)
         return {"error": "unknown"}
 
+    profile = data.get("profile", {})
+    return {
+        "title": profile.get("name", "Torn City"),
+        "user_id": profile.get("id"),
+        "unserved_categories": await async_get_unserved_categories(client),
+    }
+
+
+async def async_get_unserved_categories(client: TornClient) -> list[str]:
+    """Return the optional categories the key cannot read (empty if the probe fails)."""
+    try:
+        selections = await client.async_get_selections()
+    except TornError as err:
+        _LOGGER.warning("Could not probe API key access: %s", err)
+        return []
+    return get_unserved_categories(selections)
+
 
 class TornConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Torn City."""
@@ -69,8 +102,8 @@ class TornConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            session = async_create_clientsession(self.hass)
-            result = await validate_api_key(user_input[CONF_API_KEY], session)
+            client = TornClient(async_get_clientsession(self.hass), user_input[CONF_API_KEY])
+            result = await validate_api_key(client)
 
             if "error" in result:
                 errors["base"] = result["error"]
@@ -79,9 +112,11 @@ class TornConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.async_set_unique_id(str(result["user_id"]))
                 self._abort_if_unique_id_configured()
 
+                # Start with the categories the key cannot read switched off
                 return self.async_create_entry(
                     title=result["title"],
                     data=user_input,
+                    options={category: False for category in result["unserved_categories"]},
                 )
 
         return self.async_show_form(
@@ -98,8 +133,21 @@ class TornOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            # Household entities have fixed unique IDs, so only one entry may show them
+            if user_input.get(CONF_HOUSEHOLD, False) and any(
+                entry.options.get(CONF_HOUSEHOLD, False)
+                for entry in self.hass.config_entries.async_entries(DOMAIN)
+                if entry.entry_id != self.config_entry.entry_id
+            ):
+                errors[CONF_HOUSEHOLD] = "household_taken"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        client = TornClient(async_get_clientsession(self.hass), self.config_entry.data[CONF_API_KEY])
+        unserved_categories = await async_get_unserved_categories(client)
 
         # Build schema from endpoint categories
         schema_dict = {}
@@ -112,10 +160,63 @@ class TornOptionsFlowHandler(config_entries.OptionsFlow):
             current_value = self.config_entry.options.get(
                 category_key, category_config["enabled_by_default"]
             )
+            # Categories the key cannot read are offered switched off
+            if category_key in unserved_categories:
+                current_value = False
 
             schema_dict[vol.Optional(category_key, default=current_value)] = bool
 
+        # Extra personal stats to expose as sensors (comma-separated stat names)
+        schema_dict[vol.Optional(
+            CONF_PERSONALSTATS_EXTRA,
+            default=self.config_entry.options.get(CONF_PERSONALSTATS_EXTRA, ""),
+        )] = str
+
+        # How often ticking countdowns (travel time left) update locally
+        schema_dict[vol.Optional(
+            CONF_COUNTDOWN_RESOLUTION,
+            default=self.config_entry.options.get(CONF_COUNTDOWN_RESOLUTION, DEFAULT_COUNTDOWN_RESOLUTION),
+        )] = vol.In(list(COUNTDOWN_RESOLUTIONS))
+
+        # Minutes without a player action before fast polling slows down (0 = never)
+        schema_dict[vol.Optional(
+            CONF_IDLE_AFTER,
+            default=self.config_entry.options.get(CONF_IDLE_AFTER, DEFAULT_IDLE_AFTER),
+        )] = vol.All(vol.Coerce(int), vol.Range(min=0))
+
+        # Import hourly statistics of prices, battle stats and money into the recorder
+        schema_dict[vol.Optional(
+            CONF_LONG_TERM_STATISTICS,
+            default=self.config_entry.options.get(CONF_LONG_TERM_STATISTICS, True),
+        )] = bool
+
+        # Show totals over all loaded accounts on a Household device (enable on one account)
+        schema_dict[vol.Optional(
+            CONF_HOUSEHOLD,
+            default=self.config_entry.options.get(CONF_HOUSEHOLD, False),
+        )] = bool
+
+        # Write timed spans of sampled update cycles to torn_trace.jsonl
+        schema_dict[vol.Optional(
+            CONF_TRACING,
+            default=self.config_entry.options.get(CONF_TRACING, False),
+        )] = bool
+        schema_dict[vol.Optional(
+            CONF_TRACE_SAMPLE_PERCENT,
+            default=self.config_entry.options.get(CONF_TRACE_SAMPLE_PERCENT, DEFAULT_TRACE_SAMPLE_PERCENT),
+        )] = vol.All(vol.Coerce(int), vol.Range(min=1, max=100))
+
+        data_schema = vol.Schema(schema_dict)
+        if user_input is not None:
+            data_schema = self.add_suggested_values_to_schema(data_schema, user_input)
+
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders={
+                "unavailable": ", ".join(
+                    ENDPOINT_CATEGORIES[category]["name"] for category in unserved_categories
+                ) or "none",
+            },
         )
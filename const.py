@@ -1,12 +1,21 @@
 """Constants for the Torn City integration."""
+import os
 
 DOMAIN = "torn"
 
+# Directory holding the integration's source files
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # API Configuration
 API_BASE_URL = "https://api.torn.com"
 API_TIMEOUT = 10
 API_RATE_LIMIT = 100  # requests per minute
 
+# Hedged requests: a second request is sent when the first has not answered
+# by the endpoint's p95 latency (only for endpoints with "hedge": True)
+HEDGE_LATENCY_SAMPLES = 50
+HEDGE_MIN_SAMPLES = 10
+
 # Configuration
 CONF_API_KEY = "api_key"
 CONF_UPDATE_INTERVAL = "update_interval"
@@ -20,17 +29,181 @@ CONF_ENABLE_COMPANY = "enable_company"
 CONF_ENABLE_STOCKS = "enable_stocks"
 CONF_ENABLE_REFILLS = "enable_refills"
 CONF_ENABLE_LOG = "enable_log"
+CONF_ENABLE_CATALOG = "enable_catalog"
+CONF_ENABLE_EVENTS = "enable_events"
+CONF_PERSONALSTATS_EXTRA = "personalstats_extra"
+CONF_COUNTDOWN_RESOLUTION = "countdown_resolution"
+CONF_IDLE_AFTER = "idle_after"
+CONF_TRACING = "tracing"
+CONF_TRACE_SAMPLE_PERCENT = "trace_sample_percent"
+CONF_HOUSEHOLD = "household"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+# Hours of statistics kept while the recorder is not running
+STATISTICS_MAX_PENDING_HOURS = 48
 
 # Default values
 DEFAULT_SCAN_INTERVAL = 1
+DEFAULT_COUNTDOWN_RESOLUTION = "second"
+DEFAULT_IDLE_AFTER = 30  # minutes without a player action, 0 disables
+DEFAULT_TRACE_SAMPLE_PERCENT = 10  # percent of update cycles traced
+
+# How often ticking countdown sensors write their state (in seconds)
+COUNTDOWN_RESOLUTIONS = {"second": 1, "minute": 60}
 
 # Cache durations for different endpoint types (in seconds)
 CACHE_DURATION_SHORT = 5
 CACHE_DURATION_MEDIUM = 60
 CACHE_DURATION_LONG = 600
+CACHE_DURATION_DAY = 86400
+
+# Polling profiles: update interval (in seconds) per cache tier, switchable at runtime
+POLLING_PROFILE_ACTIVE = "active"
+POLLING_PROFILE_IDLE = "idle"
+POLLING_PROFILE_NIGHT = "night"
+POLLING_PROFILE_CHAIN = "chain"
+DEFAULT_POLLING_PROFILE = POLLING_PROFILE_ACTIVE
+POLLING_PROFILES: dict[str, dict[int, int]] = {
+    POLLING_PROFILE_ACTIVE: {
+        CACHE_DURATION_SHORT: 5,
+        CACHE_DURATION_MEDIUM: 60,
+        CACHE_DURATION_LONG: 600,
+        CACHE_DURATION_DAY: CACHE_DURATION_DAY,
+    },
+    POLLING_PROFILE_IDLE: {
+        CACHE_DURATION_SHORT: 60,
+        CACHE_DURATION_MEDIUM: 300,
+        CACHE_DURATION_LONG: 1800,
+        CACHE_DURATION_DAY: CACHE_DURATION_DAY,
+    },
+    POLLING_PROFILE_NIGHT: {
+        CACHE_DURATION_SHORT: 600,
+        CACHE_DURATION_MEDIUM: 3600,
+        CACHE_DURATION_LONG: 3600,
+        CACHE_DURATION_DAY: CACHE_DURATION_DAY,
+    },
+    # Bars (chain timer) stay fast; slower tiers back off to leave rate budget
+    POLLING_PROFILE_CHAIN: {
+        CACHE_DURATION_SHORT: 5,
+        CACHE_DURATION_MEDIUM: 300,
+        CACHE_DURATION_LONG: 3600,
+        CACHE_DURATION_DAY: CACHE_DURATION_DAY,
+    },
+}
+
+# While the player is idle, the short tier polls at most this often (in seconds).
+# The profile endpoint stays in that tier, so activity is still noticed.
+IDLE_SHORT_TIER_INTERVAL = 60
+
+# Adaptive throttling (AIMD) per API key: the allowed rate is multiplied by the
+# decrease factor on a rate-limit error and raised by the step after a run of
+# successful requests
+THROTTLE_MIN_RATE = 10  # requests per minute
+THROTTLE_DECREASE_FACTOR = 0.5
+THROTTLE_DECREASE_COOLDOWN = 10  # seconds in which further rate-limit errors are ignored
+THROTTLE_INCREASE_STEP = 5  # requests per minute
+THROTTLE_INCREASE_AFTER = 20  # successful requests
+
+# Key capability probe: which sections and selections the API key may read
+KEY_INFO_PATH = "/v2/key/info"
+KEY_PROBE_INTERVAL = 21600  # seconds between re-probes
+
+# Local log archive (SQLite database in the config directory, shared by all entries)
+LOG_ARCHIVE_FILENAME = "torn_log.db"
+LOG_SEARCH_DEFAULT_LIMIT = 50
+LOG_SEARCH_MAX_LIMIT = 500
+
+# On-demand profiling (saved as a pstats file in the config directory)
+PROFILE_FILENAME = "torn_profile_{timestamp}.prof"
+PROFILE_DEFAULT_CYCLES = 5
+PROFILE_MAX_CYCLES = 100
+PROFILE_DEFAULT_TOP = 20
+
+# Structured tracing (rotating JSONL file in the config directory, shared by all entries)
+TRACE_FILENAME = "torn_trace.jsonl"
+TRACE_MAX_BYTES = 5 * 1024 * 1024
+TRACE_BACKUP_COUNT = 3
+
+# Household totals (summed over all loaded entries, shown on the entry that enables them)
+HOUSEHOLD_FIGURES = ("cash", "networth", "portfolio")
+
+# Data keys the live networth estimate is computed from
+NETWORTH_DATA_KEYS = {"money", "user_stocks", "torn_stocks"}
+
+# Memory report (heap growth is compared across coordinator cycles)
+MEMORY_DEFAULT_CYCLES = 3
+MEMORY_MAX_CYCLES = 50
+
+# Seconds the profile and memory services wait for the requested cycles
+CYCLE_WAIT_TIMEOUT = 600
+
+# Events feed (cursor and history persisted per config entry)
+EVENTS_STORAGE_KEY = f"{DOMAIN}.events"
+EVENTS_STORAGE_VERSION = 1
+EVENTS_HISTORY_SIZE = 50
+EVENTS_SAVE_DELAY = 10  # seconds
+EVENTS_MAX_PAGES = 5  # pages fetched per update while catching up on a backlog
+
+# Live networth reconciliation (persisted per config entry)
+NETWORTH_STORAGE_KEY = f"{DOMAIN}.networth"
+NETWORTH_STORAGE_VERSION = 1
+NETWORTH_SAVE_DELAY = 10  # seconds
+
+# Stock analytics (samples are taken once per torn_stocks refresh)
+STOCK_ANALYTICS_WINDOW = 60
+STOCK_ANALYTICS_EMA_SPAN = 12
+
+# Personal stats: extra stats are requested by name (the API accepts up to 10 per call)
+PERSONALSTATS_MAX_STATS = 10
+
+# Data keys that are only read by entities with these unique ID prefixes.
+# When all of those entities are disabled, the endpoint is not requested.
+DATA_KEY_ENTITY_PREFIXES = {
+    "personalstats": "battlestats_",
+}
+
+# Item reference catalog (shared by all config entries, persisted to disk)
+CATALOG_STORAGE_KEY = f"{DOMAIN}.catalog"
+CATALOG_STORAGE_VERSION = 1
+CATALOG_ITEM_FIELDS = ("name", "type", "market_value", "buy_price", "sell_price", "circulation")
+
+# Services
+SERVICE_REFRESH = "refresh"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_DATA_KEYS = "data_keys"
+SERVICE_SET_POLLING_PROFILE = "set_polling_profile"
+ATTR_PROFILE = "profile"
+SERVICE_SEARCH_LOG = "search_log"
+ATTR_CATEGORY = "category"
+ATTR_LOG_TYPE = "log_type"
+ATTR_TITLE = "title"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+ATTR_OFFSET = "offset"
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+ATTR_TOP = "top"
+SERVICE_MEMORY_REPORT = "memory_report"
+
+# Events fired on the Home Assistant bus when data changes semantically
+EVENT_STATUS_CHANGED = f"{DOMAIN}_status_changed"
+EVENT_HOSPITAL_LEFT = f"{DOMAIN}_hospital_left"
+EVENT_JAIL_LEFT = f"{DOMAIN}_jail_left"
+EVENT_TRAVEL_DEPARTED = f"{DOMAIN}_travel_departed"
+EVENT_TRAVEL_LANDED = f"{DOMAIN}_travel_landed"
+EVENT_BAR_FULL = f"{DOMAIN}_bar_full"
+EVENT_CHAIN_EXPIRING = f"{DOMAIN}_chain_expiring"
+EVENT_CHAIN_ENDED = f"{DOMAIN}_chain_ended"
+EVENT_WALLET_DROPPED = f"{DOMAIN}_wallet_dropped"
+EVENT_COOLDOWN_ENDED = f"{DOMAIN}_cooldown_ended"
+EVENT_TORN_EVENT = f"{DOMAIN}_event"  # a new entry in the player's events feed
+CHAIN_EXPIRING_THRESHOLD = 60  # seconds left on the chain timer before warning
 
 # Endpoint categories and their mapping
 # Each category can be enabled/disabled in options
+# Optional endpoint keys: "params", "timeout" (seconds, defaults to API_TIMEOUT),
+# "hedge" (send a hedged request for latency-critical endpoints), "reference",
+# "incremental" (only request entries after a persisted cursor)
 ENDPOINT_CATEGORIES = {
     "core": {
         "name": "Profile & Bars",
@@ -38,8 +211,8 @@ ENDPOINT_CATEGORIES = {
         "enabled_by_default": True,
         "can_disable": False,
         "endpoints": [
-            {"path": "/v2/user/basic", "key": "profile", "cache_for": CACHE_DURATION_SHORT},
-            {"path": "/v2/user/bars", "key": "bars", "cache_for": CACHE_DURATION_SHORT},
+            {"path": "/v2/user/profile", "key": "profile", "cache_for": CACHE_DURATION_SHORT, "timeout": 5},
+            {"path": "/v2/user/bars", "key": "bars", "cache_for": CACHE_DURATION_SHORT, "timeout": 5, "hedge": True},
         ],
     },
     CONF_ENABLE_MONEY: {
@@ -48,7 +221,7 @@ ENDPOINT_CATEGORIES = {
         "enabled_by_default": True,
         "can_disable": True,
         "endpoints": [
-            {"path": "/v2/user/money", "key": "money", "cache_for": CACHE_DURATION_SHORT},
+            {"path": "/v2/user/money", "key": "money", "cache_for": CACHE_DURATION_SHORT, "timeout": 5},
         ],
     },
     CONF_ENABLE_TRAVEL: {
@@ -57,7 +230,7 @@ ENDPOINT_CATEGORIES = {
         "enabled_by_default": True,
         "can_disable": True,
         "endpoints": [
-            {"path": "/v2/user/travel", "key": "travel", "cache_for": CACHE_DURATION_SHORT},
+            {"path": "/v2/user/travel", "key": "travel", "cache_for": CACHE_DURATION_SHORT, "timeout": 5, "hedge": True},
         ],
     },
     CONF_ENABLE_COOLDOWNS: {
@@ -75,7 +248,7 @@ ENDPOINT_CATEGORIES = {
         "enabled_by_default": True,
         "can_disable": True,
         "endpoints": [
-            {"path": "/v2/user/personalstats", "key": "personalstats", "params": {"cat": "all"}, "cache_for": CACHE_DURATION_MEDIUM},
+            {"path": "/v2/user/personalstats", "key": "personalstats", "params": {"cat": "battle_stats"}, "cache_for": CACHE_DURATION_MEDIUM, "timeout": 30},
         ],
     },
     CONF_ENABLE_SKILLS: {
@@ -125,30 +298,88 @@ ENDPOINT_CATEGORIES = {
             {"path": "/v2/user/log", "key": "log", "params": {"limit": "10"}, "cache_for": CACHE_DURATION_SHORT},
         ],
     },
+    CONF_ENABLE_EVENTS: {
+        "name": "Events",
+        "description": "New entries in the events feed (attacks, trades, bazaar sales)",
+        "enabled_by_default": False,
+        "can_disable": True,
+        "endpoints": [
+            {"path": "/v2/user/events", "key": "events", "params": {"limit": "100"}, "cache_for": CACHE_DURATION_MEDIUM, "incremental": True},
+        ],
+    },
+    CONF_ENABLE_CATALOG: {
+        "name": "Item Catalog",
+        "description": "Item reference data and market values (refreshed daily)",
+        "enabled_by_default": True,
+        "can_disable": True,
+        "endpoints": [
+            # Reference endpoints feed the shared item catalog instead of coordinator data
+            {"path": "/torn", "key": "items", "params": {"selections": "items"}, "cache_for": CACHE_DURATION_DAY, "timeout": 30, "reference": True},
+        ],
+    },
+}
+
+# Projection schema per data key: only these fields are kept at ingest time.
+# True keeps a value as is, "*" applies a schema to every value of an ID-keyed
+# dict, and lists are projected per element (see projection.py).
+# Data keys with a typed model (see models.py) are projected by their model.
+ENDPOINT_FIELDS = {
+    "personalstats": {"battle_stats": True},
+    "personalstats_extra": {"name": True, "value": True},
+    "skills": {"slug": True, "name": True, "level": True},
+    "refills": {"energy_refill_used": True, "nerve_refill_used": True, "token_refill_used": True},
+    "events": {"id": True, "timestamp": True, "event": True},
+    # Log data and params are exposed by the Log Latest sensor and archived, so they are kept
+    "log": {
+        "id": True,
+        "timestamp": True,
+        "details": {"id": True, "title": True, "category": True},
+        "data": True,
+        "params": True,
+    },
 }
 
+
 # API Endpoints to fetch (built from enabled categories)
 # This is now dynamically built based on enabled categories
 API_ENDPOINTS = [
-    {"path": "/v2/user/basic", "key": "profile", "cache_for": CACHE_DURATION_SHORT},
-    {"path": "/v2/user/bars", "key": "bars", "cache_for": CACHE_DURATION_SHORT},
-    {"path": "/v2/user/money", "key": "money", "cache_for": CACHE_DURATION_SHORT},
-    {"path": "/v2/user/travel", "key": "travel", "cache_for": CACHE_DURATION_SHORT},
+    {"path": "/v2/user/profile", "key": "profile", "cache_for": CACHE_DURATION_SHORT, "timeout": 5},
+    {"path": "/v2/user/bars", "key": "bars", "cache_for": CACHE_DURATION_SHORT, "timeout": 5, "hedge": True},
+    {"path": "/v2/user/money", "key": "money", "cache_for": CACHE_DURATION_SHORT, "timeout": 5},
+    {"path": "/v2/user/travel", "key": "travel", "cache_for": CACHE_DURATION_SHORT, "timeout": 5, "hedge": True},
     {"path": "/v2/user/log", "key": "log", "params": {"limit": "10"}, "cache_for": CACHE_DURATION_SHORT},
     {"path": "/v2/user/cooldowns", "key": "cooldowns", "cache_for": CACHE_DURATION_MEDIUM},
-    {"path": "/v2/user/personalstats", "key": "personalstats", "params": {"cat": "all"}, "cache_for": CACHE_DURATION_MEDIUM},
+    {"path": "/v2/user/personalstats", "key": "personalstats", "params": {"cat": "battle_stats"}, "cache_for": CACHE_DURATION_MEDIUM, "timeout": 30},
     {"path": "/company", "key": "company_detailed", "params": {"selections": "detailed"}, "cache_for": CACHE_DURATION_MEDIUM},
     {"path": "/company", "key": "company", "cache_for": CACHE_DURATION_MEDIUM},
     {"path": "/v2/user/skills", "key": "skills", "cache_for": CACHE_DURATION_LONG},
     {"path": "/user", "key": "refills", "params": {"selections": "refills"}, "cache_for": CACHE_DURATION_LONG},
     {"path": "/torn", "key": "torn_stocks", "params": {"selections": "stocks"}, "cache_for": CACHE_DURATION_MEDIUM},
     {"path": "/user", "key": "user_stocks", "params": {"selections": "stocks"}, "cache_for": CACHE_DURATION_MEDIUM},
+    {"path": "/torn", "key": "items", "params": {"selections": "items"}, "cache_for": CACHE_DURATION_DAY, "timeout": 30, "reference": True},
 ]
 
 
-def get_enabled_endpoints(options: dict) -> list[dict]:
-    """Get list of enabled endpoints based on options."""
+def parse_stat_list(value: str | None) -> list[str]:
+    """Parse a comma-separated list of personal stat names."""
+    if not value:
+        return []
+    stats: list[str] = []
+    for stat in value.split(","):
+        stat = stat.strip().lower()
+        if stat and stat not in stats:
+            stats.append(stat)
+    return stats[:PERSONALSTATS_MAX_STATS]
+
+
+def get_enabled_endpoints(options: dict, disabled_keys: set[str] | None = None) -> list[dict]:
+    """Get list of enabled endpoints based on options.
+
+    Endpoints whose data key is in disabled_keys (no enabled entity reads
+    them) are skipped.
+    """
     enabled_endpoints = []
+    disabled_keys = disabled_keys or set()
 
     for category_key, category_config in ENDPOINT_CATEGORIES.items():
         # Core endpoints are always enabled
@@ -160,6 +391,49 @@ def get_enabled_endpoints(options: dict) -> list[dict]:
         is_enabled = options.get(category_key, category_config["enabled_by_default"])
 
         if is_enabled:
-            enabled_endpoints.extend(category_config["endpoints"])
+            enabled_endpoints.extend(
+                ep for ep in category_config["endpoints"] if ep["key"] not in disabled_keys
+            )
+
+    # Extra personal stats selected by the user, fetched by name only
+    if options.get(CONF_ENABLE_STATS, True) and (stats := parse_stat_list(options.get(CONF_PERSONALSTATS_EXTRA))):
+        enabled_endpoints.append({
+            "path": "/v2/user/personalstats",
+            "key": "personalstats_extra",
+            "response_key": "personalstats",
+            "params": {"stat": ",".join(stats)},
+            "cache_for": CACHE_DURATION_MEDIUM,
+        })
 
     return enabled_endpoints
+
+
+def endpoint_selection(endpoint: dict) -> tuple[str, str]:
+    """Return the (section, selection) an endpoint reads, as listed by key info."""
+    parts = endpoint["path"].strip("/").split("/")
+    if parts[0] == "v2":
+        parts = parts[1:]
+    if len(parts) > 1:
+        return parts[0], parts[1]
+    # v1 paths select with a parameter; without one the section returns its profile
+    return parts[0], endpoint.get("params", {}).get("selections", "profile")
+
+
+def get_unserved_data_keys(selections: dict[str, list[str]], endpoints: list[dict]) -> set[str]:
+    """Return data keys of endpoints the key is not allowed to read."""
+    unserved = set()
+    for endpoint in endpoints:
+        section, selection = endpoint_selection(endpoint)
+        if selection not in selections.get(section, ()):
+            unserved.add(endpoint["key"])
+    return unserved
+
+
+def get_unserved_categories(selections: dict[str, list[str]]) -> list[str]:
+    """Return the optional categories the key cannot serve at all."""
+    return [
+        category_key
+        for category_key, category_config in ENDPOINT_CATEGORIES.items()
+        if category_config["can_disable"]
+        and len(get_unserved_data_keys(selections, category_config["endpoints"])) == len(category_config["endpoints"])
+    ]
@@ -1,137 +1,552 @@
 """DataUpdateCoordinator for Torn City integration."""
 from __future__ import annotations
 
+import asyncio
+from contextlib import AbstractContextManager, nullcontext
+import json
 import logging
 from datetime import timedelta
 from time import time
+from collections.abc import Callable
 from typing import Any
 
-import aiohttp
-
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import API_BASE_URL, API_ENDPOINTS, API_TIMEOUT, DOMAIN, get_enabled_endpoints
+from .api import TornClient, TornError
+from .catalog import TornItemCatalog
+from .const import (
+    API_TIMEOUT,
+    CACHE_DURATION_SHORT,
+    CONF_IDLE_AFTER,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_TRACE_SAMPLE_PERCENT,
+    CONF_TRACING,
+    DEFAULT_IDLE_AFTER,
+    DEFAULT_TRACE_SAMPLE_PERCENT,
+    DEFAULT_POLLING_PROFILE,
+    DOMAIN,
+    ENDPOINT_FIELDS,
+    EVENTS_MAX_PAGES,
+    IDLE_SHORT_TIER_INTERVAL,
+    NETWORTH_DATA_KEYS,
+    POLLING_PROFILES,
+    get_enabled_endpoints,
+)
+from .events import TornEventDetector
+from .events_feed import TornEventsFeed
+from .household import TornHousehold
+from .log_archive import TornLogArchive
+from .long_term_stats import TornStatisticsImporter
+from .models import Profile, TornDecodeError, decode_endpoint, to_primitive
+from .networth import TornNetworthEstimator
+from .profiler import TornCycleProfiler
+from .projection import project
+from .stock_analytics import StockMarketAnalytics
+from .stock_roi import StockRoiEngine
+from .throttle import TornAdaptiveThrottle
+from .tracing import TornTracer, activate, deactivate, span
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class TornDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Torn City data update coordinator."""
+class TornDataHub:
+    """State shared by the tier coordinators of one config entry.
+
+    Endpoints are grouped into one coordinator per cache cadence, so each
+    tier polls on its own schedule and only notifies the entities reading it.
+    The cache, in-flight requests and the API client live here.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
-        session: aiohttp.ClientSession,
-        api_key: str,
-        update_interval: timedelta,
+        client: TornClient,
         throttle_api: bool = False,
         enabled_endpoint_options: dict[str, Any] | None = None,
+        catalog: TornItemCatalog | None = None,
+        entry_id: str | None = None,
+        disabled_data_keys: set[str] | None = None,
+        throttle: TornAdaptiveThrottle | None = None,
+        log_archive: TornLogArchive | None = None,
+        tracer: TornTracer | None = None,
+        household: TornHousehold | None = None,
+        market_statistics: TornStatisticsImporter | None = None,
     ) -> None:
-        """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=update_interval,
-        )
-        self.session = session
-        self.api_key = api_key
+        """Initialize the hub and its tier coordinators."""
+        self.hass = hass
+        self.client = client
         self.throttle_multiplier = 10 if throttle_api else 1
+        # Adaptive rate control shared by every entry using the same API key
+        self.throttle = throttle
         self._cache: dict[str, Any] = {}  # Cached data per endpoint key
         self.cache_times: dict[str, float] = {}  # Last fetch time per endpoint key (public for sensors)
 
         # Get enabled endpoints based on options
-        self.enabled_endpoints = get_enabled_endpoints(enabled_endpoint_options or {})
+        self.enabled_endpoints = get_enabled_endpoints(enabled_endpoint_options or {}, disabled_data_keys)
         # Build set of enabled data keys for quick lookup
         self.enabled_data_keys = {ep["key"] for ep in self.enabled_endpoints}
 
+        # Rolling analytics over the whole stock market
+        self.stock_analytics = StockMarketAnalytics()
+        # Return of the next benefit block of every stock
+        self.stock_roi = StockRoiEngine()
+        # Shared item reference catalog (fed by reference endpoints)
+        self.catalog = catalog
+        self.entry_id = entry_id
+        # Every fetched log entry is stored in the local archive
+        self.log_archive = log_archive
+        # Live networth from money and stock holdings between daily snapshots
+        self.networth = TornNetworthEstimator(
+            hass, entry_id, {"user_stocks", "torn_stocks"} <= self.enabled_data_keys
+        )
+        # Money and holdings are summed with the other loaded entries
+        self.household = household
+        # Fires torn_* events on semantic transitions between snapshots
+        self.event_detector = TornEventDetector(hass, entry_id)
+        # Reads the events feed from a persisted cursor
+        self.events_feed = (
+            TornEventsFeed(hass, entry_id) if entry_id and "events" in self.enabled_data_keys else None
+        )
+        # In-flight requests per data key, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        # Active polling profile, which sets the update interval of each tier
+        self.polling_profile = DEFAULT_POLLING_PROFILE
+        self._profile_listeners: list[Callable[[], None]] = []
+        # The short tier slows down once the player has not acted for this long (seconds)
+        options = enabled_endpoint_options or {}
+        self.idle_after = options.get(CONF_IDLE_AFTER, DEFAULT_IDLE_AFTER) * 60
+        self.player_idle = False
+        # Set while the profile service records the next cycles
+        self.profiler: TornCycleProfiler | None = None
+        self._cycle_listeners: list[Callable[[], None]] = []
+        # Timed spans of a sample of the update cycles
+        self.tracer = tracer if options.get(CONF_TRACING, False) else None
+        self.trace_sample_rate = options.get(CONF_TRACE_SAMPLE_PERCENT, DEFAULT_TRACE_SAMPLE_PERCENT) / 100
+        # Hourly long-term statistics of player figures, and of market prices shared by all entries
+        long_term_statistics = entry_id is not None and options.get(CONF_LONG_TERM_STATISTICS, True)
+        self.statistics = TornStatisticsImporter(hass, entry_id) if long_term_statistics else None
+        self.market_statistics = market_statistics if long_term_statistics else None
+
+        # One coordinator per cache cadence
+        tiers: dict[int, list[dict[str, Any]]] = {}
+        for endpoint_config in self.enabled_endpoints:
+            tiers.setdefault(endpoint_config.get("cache_for", CACHE_DURATION_SHORT), []).append(endpoint_config)
+
+        self.coordinators: dict[int, TornDataUpdateCoordinator] = {
+            cache_for: TornDataUpdateCoordinator(
+                hass,
+                self,
+                endpoints,
+                f"{DOMAIN}_{cache_for}s",
+                self._tier_interval(cache_for),
+            )
+            for cache_for, endpoints in sorted(tiers.items())
+        }
+        self._coordinator_by_key = {
+            data_key: coordinator
+            for coordinator in self.coordinators.values()
+            for data_key in coordinator.data_keys
+        }
+
+    @callback
+    def async_catalog_changed(self) -> None:
+        """Reprice stock benefits and update catalog consumers after a catalog refresh.
+
+        Reference data never enters the tier data, so without this the
+        coordinators would see no change and skip their listeners.
+        """
+        self.stock_roi.update(self._cache.get("torn_stocks"), self._cache.get("user_stocks"), self.catalog)
+        for coordinator in self.coordinators.values():
+            if coordinator.data is not None and coordinator.data_keys & {"items", "torn_stocks"}:
+                coordinator.async_update_listeners()
+
+    def coordinator_for(self, data_key: str) -> TornDataUpdateCoordinator:
+        """Return the tier coordinator that fetches a data key."""
+        return self._coordinator_by_key[data_key]
+
+    def _tier_interval(self, cache_for: int) -> timedelta:
+        """Return the update interval of a tier under the active polling profile."""
+        seconds = POLLING_PROFILES[self.polling_profile].get(cache_for, cache_for)
+        if self.player_idle and cache_for == CACHE_DURATION_SHORT:
+            seconds = max(seconds, IDLE_SHORT_TIER_INTERVAL)
+        if self.throttle is not None:
+            seconds *= self.throttle.interval_multiplier
+        return timedelta(seconds=seconds * self.throttle_multiplier)
+
+    @callback
+    def async_set_polling_profile(self, profile: str) -> None:
+        """Switch the polling profile and reschedule the tiers."""
+        if profile == self.polling_profile:
+            return
+        _LOGGER.debug(f"Switching polling profile from {self.polling_profile} to {profile}")
+        self.polling_profile = profile
+        self._async_apply_intervals(refresh_sooner=True)
+
+    @callback
+    def async_throttle_changed(self) -> None:
+        """Reschedule the tiers after the adaptive rate changed.
+
+        The new interval applies after each tier's pending refresh; refreshing
+        right away on every recovery step would spend the budget being rebuilt.
+        """
+        self._async_apply_intervals()
+
+    @callback
+    def _async_apply_intervals(self, refresh_sooner: bool = False) -> None:
+        """Recompute the update interval of every tier."""
+        for cache_for, coordinator in self.coordinators.items():
+            previous = coordinator.update_interval
+            coordinator.update_interval = self._tier_interval(cache_for)
+            # A longer interval applies after the pending refresh; a shorter one right away
+            if refresh_sooner and previous is not None and coordinator.update_interval < previous:
+                self.hass.async_create_task(coordinator.async_request_refresh())
+
+        for listener in list(self._profile_listeners):
+            listener()
+
+    @callback
+    def async_add_profile_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call a listener when the polling profile changes; return a remover."""
+        self._profile_listeners.append(listener)
+        return lambda: self._profile_listeners.remove(listener)
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Fetch initial data for all tiers concurrently.
+
+        Only the tier serving the core profile can fail the setup; the other
+        tiers retry on their own schedule.
+        """
+        if self.events_feed is not None:
+            await self.events_feed.async_load()
+        await self.networth.async_load()
+
+        core = self._coordinator_by_key.get("profile") or next(iter(self.coordinators.values()))
+        await asyncio.gather(
+            core.async_config_entry_first_refresh(),
+            *(coordinator.async_refresh() for coordinator in self.coordinators.values() if coordinator is not core),
+        )
+
+    async def async_refresh_keys(self, data_keys: set[str]) -> set[str]:
+        """Bypass the cache and refetch only the given data keys.
+
+        Concurrent callers asking for the same key share one in-flight request.
+        Returns the keys that were fetched successfully.
+        """
+        coordinators = {
+            coordinator
+            for data_key, coordinator in self._coordinator_by_key.items()
+            if data_key in data_keys
+        }
+        results = await asyncio.gather(
+            *(coordinator.async_refresh_keys(data_keys & coordinator.data_keys) for coordinator in coordinators)
+        )
+        return set().union(*results)
+
+    @callback
+    def async_add_cycle_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call a listener after every completed tier update; return a remover."""
+        self._cycle_listeners.append(listener)
+        return lambda: self._cycle_listeners.remove(listener)
+
+    @callback
+    def async_cycle_finished(self) -> None:
+        """Notify the cycle listeners that a tier update completed."""
+        for listener in list(self._cycle_listeners):
+            listener()
+
+    def profiling(self) -> AbstractContextManager[None]:
+        """Return a context that records its code when a profile is running."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.measure()
+
+    def process_fetched(self, combined_data: dict[str, Any], fetched_keys: set[str], current_time: float) -> None:
+        """Run derived computations for freshly fetched data."""
+        # Run stock analytics once per market update, not on every tick
+        if "torn_stocks" in fetched_keys:
+            self.stock_analytics.update(combined_data["torn_stocks"], current_time)
+
+        # Block prices follow the market, the next block size follows owned blocks
+        if fetched_keys & {"torn_stocks", "user_stocks"}:
+            self.stock_roi.update(self._cache.get("torn_stocks"), self._cache.get("user_stocks"), self.catalog)
+
+        self.event_detector.process(combined_data, fetched_keys)
+
+        if "log" in fetched_keys and self.log_archive is not None and self.entry_id is not None:
+            self.hass.async_create_task(self.log_archive.async_ingest(self.entry_id, combined_data["log"]))
+
+        if "profile" in fetched_keys:
+            self._update_player_activity(combined_data["profile"], current_time)
+
+        if fetched_keys & NETWORTH_DATA_KEYS:
+            self._update_networth(current_time)
+
+        if self.statistics is not None:
+            self.statistics.async_record_player(self, fetched_keys, current_time)
+        if self.market_statistics is not None and "torn_stocks" in fetched_keys:
+            self.market_statistics.async_record_market(combined_data["torn_stocks"], current_time)
+
+    def _update_networth(self, current_time: float) -> None:
+        """Update the live networth and this entry's household contribution."""
+        # Money and stocks live in different tiers, so read the shared cache
+        self.networth.async_update(
+            self._cache.get("money"),
+            self._cache.get("user_stocks"),
+            self._cache.get("torn_stocks"),
+            current_time,
+        )
+        if self.household is not None and self.entry_id is not None:
+            self.household.async_update_entry(
+                self.entry_id,
+                {
+                    "cash": self.networth.cash,
+                    "networth": self.networth.value,
+                    "portfolio": self.networth.portfolio,
+                },
+            )
+
+    def _update_player_activity(self, profile: Profile, current_time: float) -> None:
+        """Stretch the short tier while the player is idle, restore it on activity."""
+        last_action = profile.last_action.timestamp if profile.last_action else None
+        if not self.idle_after or not last_action:
+            player_idle = False
+        else:
+            player_idle = current_time - last_action >= self.idle_after
+
+        if player_idle != self.player_idle:
+            _LOGGER.debug(f"Player is {'idle' if player_idle else 'active'}, adjusting the short tier")
+            self.player_idle = player_idle
+            # The short tier is refreshing right now and picks up its new interval when done
+            self._async_apply_intervals()
+
+    async def async_fetch_endpoint(self, endpoint_config: dict[str, Any]) -> Any:
+        """Fetch an endpoint, joining an in-flight request for the same key if any."""
+        data_key = endpoint_config["key"]
+
+        task = self._inflight.get(data_key)
+        if task is None:
+            task = self.hass.async_create_task(self._async_request_endpoint(endpoint_config))
+            self._inflight[data_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(data_key, None))
+        else:
+            _LOGGER.debug(f"Joining in-flight request for {data_key}")
+
+        # Shield so a cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _async_request_endpoint(self, endpoint_config: dict[str, Any]) -> Any:
+        """Request a single endpoint and update the cache."""
+        data_key = endpoint_config["key"]
+        request_time = time()
+
+        incremental = endpoint_config.get("incremental", False) and self.events_feed is not None
+        pages = 0
+        while True:
+            params = endpoint_config.get("params", {})
+            if incremental:
+                params = {**params, **self.events_feed.request_params()}
+
+            data = await self.client.async_get(
+                endpoint_config["path"],
+                params,
+                timeout=endpoint_config.get("timeout", API_TIMEOUT),
+                label=data_key,
+                hedge=endpoint_config.get("hedge", False),
+            )
+            pages += 1
+
+            # Extract the actual data using the configured key
+            # The response structure is typically {"key": {...}}
+            # For endpoints with 'selections' param, the response key is the selection value
+            response_key = endpoint_config.get("response_key") or params.get("selections", data_key)
+            endpoint_data = data.get(response_key, {})
+
+            with self.profiling(), span("decode", data_key):
+                # Decode into typed models, or keep only the consumed fields for
+                # endpoints without a model
+                if (fields := ENDPOINT_FIELDS.get(data_key)) is not None:
+                    endpoint_data = project(endpoint_data, fields)
+                endpoint_data = decode_endpoint(data_key, endpoint_data)
+
+                # Incremental feeds expose their bounded history rather than the last batch
+                if incremental:
+                    batch = endpoint_data
+                    new_events = self.events_feed.async_ingest(batch)
+                    endpoint_data = list(self.events_feed.history)
+
+            if not incremental:
+                break
+            # A full page read since the cursor may be followed by newer events
+            limit = int(params.get("limit") or 0)
+            full_page = limit > 0 and isinstance(batch, list) and len(batch) >= limit
+            if "from" not in params or not full_page or not new_events:
+                break
+            if pages >= EVENTS_MAX_PAGES:
+                _LOGGER.info(f"Fetched {pages} pages of {data_key}, the rest follows on the next update")
+                break
+
+        if endpoint_config.get("reference", False):
+            if self.catalog is not None:
+                await self.catalog.async_ingest(endpoint_data, request_time)
+            _LOGGER.debug(f"Fetched reference data {data_key}")
+            return endpoint_data
+
+        # Update cache
+        self._cache[data_key] = endpoint_data
+        self.cache_times[data_key] = request_time
+        _LOGGER.debug(f"Fetched and cached {data_key}")
+        return endpoint_data
+
+    def cache_sizes(self) -> dict[str, int]:
+        """Return the serialized size in bytes of each cached endpoint payload."""
+        return {
+            data_key: len(json.dumps(to_primitive(endpoint_data), separators=(",", ":")))
+            for data_key, endpoint_data in self._cache.items()
+        }
+
+
+class TornDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Torn City data update coordinator for one cache cadence tier."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hub: TornDataHub,
+        endpoints: list[dict[str, Any]],
+        name: str,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=name,
+            update_interval=update_interval,
+            # Entities are only notified when the tier data actually changed
+            always_update=False,
+        )
+        self.hub = hub
+        self.endpoints = endpoints
+        self.data_keys = {ep["key"] for ep in endpoints}
+
+        # Data keys that were freshly fetched (not served from cache) in the last cycle
+        self.last_fetched_keys: set[str] = set()
+        # Loop time the next scheduled refresh is due, to trace how late it starts
+        self._refresh_due: float | None = None
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh and remember when it is due."""
+        super()._schedule_refresh()
+        handle = self._unsub_refresh
+        self._refresh_due = handle.when() if isinstance(handle, asyncio.TimerHandle) else None
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh data, tracing the cycle when it is sampled."""
+        hub = self.hub
+        if hub.tracer is None:
+            await super()._async_refresh(*args, **kwargs)
+            return
+
+        waited = 0.0
+        if kwargs.get("scheduled") and self._refresh_due is not None:
+            waited = max(0.0, self.hass.loop.time() - self._refresh_due)
+        trace = hub.tracer.start_trace(self.name, hub.entry_id, hub.trace_sample_rate, waited)
+        token = activate(trace)
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            deactivate(token)
+            if trace is not None:
+                hub.tracer.write(trace)
+
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Torn City API."""
+        """Fetch data for this tier from Torn City API."""
+        hub = self.hub
         combined_data = {}
+        fetched_keys: set[str] = set()
         errors = []
         current_time = time()
 
-        # Fetch data from enabled endpoints
-        for endpoint_config in self.enabled_endpoints:
+        # Fetch data from the endpoints of this tier
+        for endpoint_config in self.endpoints:
             path = endpoint_config["path"]
             data_key = endpoint_config["key"]
-            params = endpoint_config.get("params", {})
-            cache_for = endpoint_config.get("cache_for")
-
-            # Check if we have cached data that's still valid
-            if cache_for and data_key in self._cache:
-                last_fetch = self.cache_times.get(data_key, 0)
-                cache_age = current_time - last_fetch
-                effective_cache_duration = cache_for * self.throttle_multiplier
-
-                if cache_age < effective_cache_duration:
-                    # Use cached data
-                    combined_data[data_key] = self._cache[data_key]
-                    _LOGGER.debug(f"Using cached data for {data_key} (age: {cache_age:.0f}s / {effective_cache_duration}s)")
+            is_reference = endpoint_config.get("reference", False)
+
+            # Reference data lives in the shared catalog, which tracks its own age
+            if is_reference:
+                if hub.catalog is None:
+                    continue
+                if current_time - hub.catalog.fetched_at < endpoint_config.get("cache_for", 0):
                     continue
 
             try:
-                # Build URL with query parameters
-                url = f"{API_BASE_URL}{path}"
-                query_params = {"key": self.api_key, **params}
-
-                async with self.session.get(
-                    url, params=query_params, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT)
-                ) as response:
-                    if response.status != 200:
-                        error_msg = f"HTTP {response.status} on {path}"
-                        _LOGGER.warning(error_msg)
-                        errors.append(error_msg)
-                        # Use cached data if available as fallback
-                        if data_key in self._cache:
-                            combined_data[data_key] = self._cache[data_key]
-                        continue
-
-                    data = await response.json()
-
-                    if "error" in data:
-                        error_msg = f"{data['error'].get('error', 'Unknown error')} on {path}"
-                        _LOGGER.warning(f"API error: {error_msg}")
-                        errors.append(error_msg)
-                        # Use cached data if available as fallback
-                        if data_key in self._cache:
-                            combined_data[data_key] = self._cache[data_key]
-                        continue
-
-                    # Extract the actual data using the configured key
-                    # The response structure is typically {"key": {...}}
-                    # For endpoints with 'selections' param, the response key is the selection value
-                    response_key = params.get("selections", data_key)
-                    endpoint_data = data.get(response_key, {})
-                    combined_data[data_key] = endpoint_data
-
-                    # Update cache
-                    self._cache[data_key] = endpoint_data
-                    self.cache_times[data_key] = current_time
-                    _LOGGER.debug(f"Fetched and cached {data_key}")
-
-            except aiohttp.ClientError as err:
-                error_msg = f"Network error on {path}: {err}"
-                _LOGGER.warning(error_msg)
-                errors.append(error_msg)
-                # Use cached data if available as fallback
-                if data_key in self._cache:
-                    combined_data[data_key] = self._cache[data_key]
+                endpoint_data = await hub.async_fetch_endpoint(endpoint_config)
+            except (TornError, TornDecodeError) as err:
+                _LOGGER.warning(str(err))
+                errors.append(str(err))
             except Exception as err:
                 error_msg = f"Unexpected error on {path}: {err}"
                 _LOGGER.warning(error_msg)
                 errors.append(error_msg)
-                # Use cached data if available as fallback
-                if data_key in self._cache:
-                    combined_data[data_key] = self._cache[data_key]
+            else:
+                fetched_keys.add(data_key)
+                if not is_reference:
+                    combined_data[data_key] = endpoint_data
+                continue
+
+            # Use cached data if available as fallback
+            if data_key in hub._cache:
+                combined_data[data_key] = hub._cache[data_key]
 
         # If no data was retrieved at all, raise UpdateFailed
-        if not combined_data:
+        if errors and not combined_data:
             raise UpdateFailed(f"Failed to fetch any data. Errors: {', '.join(errors)}")
 
         # Log summary if there were any errors
         if errors:
-            _LOGGER.info(f"Update completed with {len(errors)} endpoint error(s): {', '.join(errors)}")
+            _LOGGER.info(f"{self.name} update completed with {len(errors)} endpoint error(s): {', '.join(errors)}")
+
+        with hub.profiling(), span("merge"):
+            hub.process_fetched(combined_data, fetched_keys, current_time)
+        self.last_fetched_keys = fetched_keys
 
+        # The entity updates of this cycle run synchronously after returning
+        hub.async_cycle_finished()
         return combined_data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, recording them when profiling."""
+        with self.hub.profiling(), span("fan_out"):
+            super().async_update_listeners()
+
+    async def async_refresh_keys(self, data_keys: set[str]) -> set[str]:
+        """Bypass the schedule and refetch the given data keys of this tier."""
+        hub = self.hub
+        endpoints = [ep for ep in self.endpoints if ep["key"] in data_keys]
+        results = await asyncio.gather(
+            *(hub.async_fetch_endpoint(ep) for ep in endpoints),
+            return_exceptions=True,
+        )
+
+        fetched_keys: set[str] = set()
+        for endpoint_config, result in zip(endpoints, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(f"Forced refresh of {endpoint_config['key']} failed: {result}")
+                continue
+            fetched_keys.add(endpoint_config["key"])
+
+        if fetched_keys:
+            combined_data = {**(self.data or {})}
+            for data_key in fetched_keys:
+                if data_key in hub._cache:
+                    combined_data[data_key] = hub._cache[data_key]
+            with hub.profiling():
+                hub.process_fetched(combined_data, fetched_keys, time())
+            self.last_fetched_keys = fetched_keys
+            self.async_set_updated_data(combined_data)
+
+        return fetched_keys
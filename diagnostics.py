@@ -0,0 +1,58 @@
+"""Diagnostics support for Torn City integration."""
+from __future__ import annotations
+
+from time import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, DOMAIN
+from .coordinator import TornDataHub
+from .memory import hub_memory_report
+
+TO_REDACT = {CONF_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    hub: TornDataHub = hass.data[DOMAIN][entry.entry_id]["hub"]
+    now = time()
+    cache_sizes = hub.cache_sizes()
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "enabled_data_keys": sorted(hub.enabled_data_keys),
+        "unserved_data_keys": sorted(hass.data[DOMAIN][entry.entry_id]["unserved_data_keys"] or []),
+        "polling_profile": hub.polling_profile,
+        "player_idle": hub.player_idle,
+        "throttle": {
+            "rate": hub.throttle.rate,
+            "max_rate": hub.throttle.max_rate,
+            "rate_limit_errors": hub.throttle.rate_limit_errors,
+        } if hub.throttle else None,
+        "tiers": {
+            coordinator.name: {
+                "update_interval": coordinator.update_interval.total_seconds(),
+                "data_keys": sorted(coordinator.data_keys),
+                "last_update_success": coordinator.last_update_success,
+            }
+            for coordinator in hub.coordinators.values()
+        },
+        "cache": {
+            data_key: {
+                "bytes": size,
+                "age": round(now - hub.cache_times.get(data_key, now), 1),
+                "latency_p95": hub.client.latency_p95(data_key),
+            }
+            for data_key, size in cache_sizes.items()
+        },
+        "cache_total_bytes": sum(cache_sizes.values()),
+        "memory": hub_memory_report(hass, hub),
+    }
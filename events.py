@@ -0,0 +1,152 @@
+"""Change-event detection for Torn City integration."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from time import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CHAIN_EXPIRING_THRESHOLD,
+    EVENT_BAR_FULL,
+    EVENT_CHAIN_ENDED,
+    EVENT_CHAIN_EXPIRING,
+    EVENT_COOLDOWN_ENDED,
+    EVENT_HOSPITAL_LEFT,
+    EVENT_JAIL_LEFT,
+    EVENT_STATUS_CHANGED,
+    EVENT_TRAVEL_DEPARTED,
+    EVENT_TRAVEL_LANDED,
+    EVENT_WALLET_DROPPED,
+)
+from .models import Bar, Bars, Chain, Cooldowns, Money, Profile, Travel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def chain_seconds_left(chain: Chain | None, now: float) -> float | None:
+    """Return seconds until the chain times out.
+
+    The timeout is reported either as seconds remaining or as a Unix
+    timestamp depending on the API version, so both are accepted.
+    """
+    timeout = chain.timeout if chain else None
+    if not timeout or timeout <= 0:
+        return None
+    if timeout > 1_000_000_000:
+        return timeout - now
+    return timeout
+
+
+def chain_timeout_at(chain: Chain, fetched_at: float) -> float | None:
+    """Return the Unix timestamp at which the chain times out."""
+    timeout = chain.timeout
+    if not timeout or timeout <= 0:
+        return None
+    if timeout > 1_000_000_000:
+        return timeout
+    return int(fetched_at) + timeout
+
+
+class TornEventDetector:
+    """Diff consecutive snapshots and fire typed events on semantic transitions."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str | None) -> None:
+        """Initialize the detector."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self._previous: dict[str, Any] = {}
+        self._chain_warned = False
+        self._detectors: dict[str, Callable[[Any, Any], None]] = {
+            "profile": self._detect_profile,
+            "travel": self._detect_travel,
+            "bars": self._detect_bars,
+            "money": self._detect_money,
+            "cooldowns": self._detect_cooldowns,
+        }
+
+    def process(self, data: dict[str, Any], changed_keys: set[str]) -> None:
+        """Compare freshly fetched data against the previous snapshot."""
+        for key in changed_keys & self._detectors.keys():
+            new = data.get(key)
+            if new is None:
+                continue
+            old = self._previous.get(key)
+            self._previous[key] = new
+            # The first snapshot only establishes a baseline
+            if old is None:
+                continue
+            try:
+                self._detectors[key](old, new)
+            except Exception as err:  # A broken detector must never fail the update
+                _LOGGER.warning(f"Event detection failed for {key}: {err}")
+
+    def _fire(self, event_type: str, old: Any, new: Any, **extra: Any) -> None:
+        """Fire an event on the Home Assistant bus."""
+        event_data = {"entry_id": self.entry_id, "old": old, "new": new, **extra}
+        _LOGGER.debug(f"Firing {event_type}: {event_data}")
+        self.hass.bus.async_fire(event_type, event_data)
+
+    def _detect_profile(self, old: Profile, new: Profile) -> None:
+        """Detect status transitions (hospital, jail, traveling, ...)."""
+        old_state = old.status.state if old.status else None
+        new_state = new.status.state if new.status else None
+        if old_state == new_state:
+            return
+
+        self._fire(EVENT_STATUS_CHANGED, old_state, new_state)
+        if old_state == "Hospital":
+            self._fire(EVENT_HOSPITAL_LEFT, old_state, new_state)
+        elif old_state == "Jail":
+            self._fire(EVENT_JAIL_LEFT, old_state, new_state)
+
+    def _detect_travel(self, old: Travel, new: Travel) -> None:
+        """Detect departures and landings."""
+        old_left = old.time_left
+        new_left = new.time_left
+        destination = new.destination
+
+        if new.departed_at != old.departed_at and new_left > 0:
+            self._fire(EVENT_TRAVEL_DEPARTED, old_left, new_left, destination=destination)
+        elif old_left > 0 and new_left == 0:
+            self._fire(EVENT_TRAVEL_LANDED, old_left, new_left, destination=destination)
+
+    def _detect_bars(self, old: Bars, new: Bars) -> None:
+        """Detect full bars and chain transitions."""
+        for bar in ("energy", "nerve", "happy", "life"):
+            old_bar: Bar = getattr(old, bar)
+            new_bar: Bar = getattr(new, bar)
+            if new_bar.maximum and new_bar.current >= new_bar.maximum > old_bar.current:
+                self._fire(EVENT_BAR_FULL, old_bar.current, new_bar.current, bar=bar, maximum=new_bar.maximum)
+
+        old_count = old.chain.current if old.chain else 0
+        new_count = new.chain.current if new.chain else 0
+
+        if old_count > 0 and new_count == 0:
+            self._chain_warned = False
+            self._fire(EVENT_CHAIN_ENDED, old_count, new_count)
+            return
+
+        seconds_left = chain_seconds_left(new.chain, time())
+        if new_count > 0 and seconds_left is not None and seconds_left <= CHAIN_EXPIRING_THRESHOLD:
+            if not self._chain_warned:
+                self._chain_warned = True
+                self._fire(EVENT_CHAIN_EXPIRING, old_count, new_count, seconds_left=round(seconds_left))
+        else:
+            # A hit resets the timer, so allow another warning later
+            self._chain_warned = False
+
+    def _detect_money(self, old: Money, new: Money) -> None:
+        """Detect wallet drops (mugged, spent, deposited)."""
+        if new.wallet < old.wallet:
+            self._fire(EVENT_WALLET_DROPPED, old.wallet, new.wallet, amount=old.wallet - new.wallet)
+
+    def _detect_cooldowns(self, old: Cooldowns, new: Cooldowns) -> None:
+        """Detect cooldowns that ran out."""
+        for cooldown in ("drug", "medical", "booster"):
+            old_value = getattr(old, cooldown)
+            new_value = getattr(new, cooldown)
+            if old_value > 0 and new_value == 0:
+                self._fire(EVENT_COOLDOWN_ENDED, old_value, new_value, cooldown=cooldown)
@@ -0,0 +1,120 @@
+"""Incremental Torn events feed for Torn City integration."""
+from __future__ import annotations
+
+from collections import deque
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    EVENT_TORN_EVENT,
+    EVENTS_HISTORY_SIZE,
+    EVENTS_SAVE_DELAY,
+    EVENTS_STORAGE_KEY,
+    EVENTS_STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TornEventsFeed:
+    """Read the player's events feed incrementally.
+
+    Only events at or after the saved cursor (the newest timestamp seen) are
+    requested; events at the cursor timestamp are deduplicated by ID. The
+    cursor and a bounded history persist across restarts, so no event is
+    fired twice.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the feed."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self._store: Store[dict[str, Any]] = Store(
+            hass, EVENTS_STORAGE_VERSION, f"{EVENTS_STORAGE_KEY}.{entry_id}"
+        )
+        self._loaded = False
+        self.cursor: int | None = None
+        self._cursor_ids: set[str] = set()
+        # Newest first
+        self.history: deque[dict[str, Any]] = deque(maxlen=EVENTS_HISTORY_SIZE)
+
+    async def async_load(self) -> None:
+        """Load the cursor and history from disk (only once)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        self.cursor = stored.get("cursor")
+        self._cursor_ids = set(stored.get("cursor_ids", []))
+        self.history.extend(stored.get("history", []))
+        _LOGGER.debug(f"Loaded events cursor {self.cursor} with {len(self.history)} events in history")
+
+    def request_params(self) -> dict[str, Any]:
+        """Return the query parameters that select events since the cursor.
+
+        Events since the cursor are requested oldest first, so a page cut off
+        at the limit leaves the newer events for the next page instead of
+        skipping older ones. The first fetch takes the newest events.
+        """
+        if self.cursor is None:
+            return {}
+        return {"from": self.cursor, "sort": "asc"}
+
+    @callback
+    def async_ingest(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add new events to the history and fire them on the bus.
+
+        The first batch ever fetched only establishes the cursor. Returns the
+        new events, oldest first.
+        """
+        if not isinstance(events, list):
+            return []
+
+        baseline = self.cursor is None
+        new_events: list[dict[str, Any]] = []
+
+        for event in sorted(events, key=lambda item: item.get("timestamp") or 0):
+            if event.get("id") is None:
+                continue
+            event_id = str(event["id"])
+            timestamp = int(event.get("timestamp") or 0)
+
+            if self.cursor is not None:
+                if timestamp < self.cursor or (timestamp == self.cursor and event_id in self._cursor_ids):
+                    continue
+
+            if self.cursor is None or timestamp > self.cursor:
+                self.cursor = timestamp
+                self._cursor_ids = {event_id}
+            else:
+                self._cursor_ids.add(event_id)
+
+            new_events.append({"id": event_id, "timestamp": timestamp, "event": event.get("event")})
+
+        if not new_events:
+            return []
+
+        for event in new_events:
+            self.history.appendleft(event)
+            if not baseline:
+                self.hass.bus.async_fire(EVENT_TORN_EVENT, {"entry_id": self.entry_id, **event})
+
+        _LOGGER.debug(f"Ingested {len(new_events)} new events, cursor is now {self.cursor}")
+        self._store.async_delay_save(self._data_to_save, EVENTS_SAVE_DELAY)
+        return new_events
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "cursor": self.cursor,
+            "cursor_ids": sorted(self._cursor_ids),
+            "history": list(self.history),
+        }
@@ -0,0 +1,72 @@
+"""Household totals across config entries for Torn City integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+
+from homeassistant.core import callback
+
+from .const import HOUSEHOLD_FIGURES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TornHousehold:
+    """Sums of money, networth and stock holdings over all loaded entries.
+
+    Each entry reports its own figures when its data changes; the totals are
+    adjusted by the difference, so an update costs the same no matter how
+    many accounts are loaded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self._figures: dict[str, dict[str, int]] = {}
+        self.totals: dict[str, int] = dict.fromkeys(HOUSEHOLD_FIGURES, 0)
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def members(self) -> int:
+        """Return the number of entries contributing to the totals."""
+        return len(self._figures)
+
+    def figures(self, entry_id: str) -> dict[str, int]:
+        """Return the figures last reported by an entry."""
+        return self._figures.get(entry_id, {})
+
+    @callback
+    def async_update_entry(self, entry_id: str, figures: dict[str, int | None]) -> None:
+        """Replace the figures of one entry and adjust the totals."""
+        previous = self._figures.get(entry_id, {})
+        current = {**previous, **{name: value for name, value in figures.items() if value is not None}}
+
+        changed = entry_id not in self._figures
+        for name in HOUSEHOLD_FIGURES:
+            if delta := current.get(name, 0) - previous.get(name, 0):
+                self.totals[name] += delta
+                changed = True
+        self._figures[entry_id] = current
+
+        if changed:
+            self._notify()
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Remove the figures of an unloaded entry from the totals."""
+        if (previous := self._figures.pop(entry_id, None)) is None:
+            return
+        for name, value in previous.items():
+            self.totals[name] -= value
+        self._notify()
+
+    @callback
+    def _notify(self) -> None:
+        """Call the listeners after the totals changed."""
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call a listener when the totals change; return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
@@ -0,0 +1,165 @@
+"""Local log archive for Torn City integration."""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOG_ARCHIVE_FILENAME
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS log (
+    entry_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    log_type INTEGER,
+    title TEXT,
+    category TEXT,
+    data TEXT,
+    params TEXT,
+    PRIMARY KEY (entry_id, id)
+);
+CREATE INDEX IF NOT EXISTS log_timestamp ON log (entry_id, timestamp);
+CREATE INDEX IF NOT EXISTS log_category ON log (entry_id, category, timestamp);
+CREATE INDEX IF NOT EXISTS log_type ON log (entry_id, log_type, timestamp);
+"""
+
+
+class TornLogArchive:
+    """SQLite archive of every ingested log entry.
+
+    One database in the config directory is shared by all config entries.
+    All database work runs in the executor; a lock serializes access to the
+    single connection.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.path = hass.config.path(LOG_ARCHIVE_FILENAME)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    async def async_open(self) -> None:
+        """Open the database and create the schema (only once)."""
+        if self._connection is None:
+            await self.hass.async_add_executor_job(self._open)
+
+    def _open(self) -> None:
+        """Open the database (executor)."""
+        with self._lock:
+            if self._connection is not None:
+                return
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            _LOGGER.debug(f"Opened log archive {self.path}")
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        await self.hass.async_add_executor_job(self._close)
+
+    def _close(self) -> None:
+        """Close the database (executor)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def async_ingest(self, entry_id: str, entries: list[dict[str, Any]]) -> None:
+        """Store log entries, ignoring those already archived."""
+        rows = [
+            (
+                entry_id,
+                str(entry["id"]),
+                int(entry.get("timestamp") or 0),
+                (entry.get("details") or {}).get("id"),
+                (entry.get("details") or {}).get("title"),
+                (entry.get("details") or {}).get("category"),
+                json.dumps(entry.get("data") or {}),
+                json.dumps(entry.get("params") or {}),
+            )
+            for entry in entries
+            if isinstance(entry, dict) and entry.get("id") is not None
+        ]
+        if rows:
+            await self.hass.async_add_executor_job(self._ingest, rows)
+
+    def _ingest(self, rows: list[tuple[Any, ...]]) -> None:
+        """Insert rows (executor)."""
+        with self._lock:
+            if self._connection is None:
+                return
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO log VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+
+    async def async_search(
+        self,
+        entry_ids: list[str],
+        *,
+        category: str | None = None,
+        log_type: int | None = None,
+        title: str | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Return matching entries (newest first) and the offset of the next page."""
+        clauses = [f"entry_id IN ({', '.join('?' * len(entry_ids))})"]
+        args: list[Any] = list(entry_ids)
+        if category is not None:
+            clauses.append("category = ? COLLATE NOCASE")
+            args.append(category)
+        if log_type is not None:
+            clauses.append("log_type = ?")
+            args.append(log_type)
+        if title is not None:
+            clauses.append("title LIKE ?")
+            args.append(f"%{title}%")
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            args.append(start)
+        if end is not None:
+            clauses.append("timestamp < ?")
+            args.append(end)
+
+        # Fetch one extra row to know whether another page exists
+        query = (
+            f"SELECT * FROM log WHERE {' AND '.join(clauses)} "
+            "ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+        )
+        rows = await self.hass.async_add_executor_job(self._query, query, [*args, limit + 1, offset])
+
+        return {
+            "entries": [
+                {
+                    "entry_id": row["entry_id"],
+                    "id": row["id"],
+                    "timestamp": row["timestamp"],
+                    "log_type": row["log_type"],
+                    "title": row["title"],
+                    "category": row["category"],
+                    "data": json.loads(row["data"]),
+                    "params": json.loads(row["params"]),
+                }
+                for row in rows[:limit]
+            ],
+            "next_offset": offset + limit if len(rows) > limit else None,
+        }
+
+    def _query(self, query: str, args: list[Any]) -> list[sqlite3.Row]:
+        """Run a read query (executor)."""
+        with self._lock:
+            if self._connection is None:
+                return []
+            return self._connection.execute(query, args).fetchall()
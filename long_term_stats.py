@@ -0,0 +1,186 @@
+"""Long-term statistics import for Torn City integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+import re
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, NETWORTH_DATA_KEYS, STATISTICS_MAX_PENDING_HOURS
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.6
+    StatisticMeanType = None
+
+if TYPE_CHECKING:
+    from .coordinator import TornDataHub
+
+_LOGGER = logging.getLogger(__name__)
+
+BATTLE_STATS = ("strength", "defense", "speed", "dexterity", "total")
+
+
+@dataclass(slots=True)
+class _HourBucket:
+    """Aggregate of the samples of one statistic within the current hour."""
+
+    name: str
+    unit: str | None
+    counter: bool
+    count: int = 0
+    total: float = 0.0
+    minimum: float = 0.0
+    maximum: float = 0.0
+    last: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        if self.count == 0:
+            self.minimum = self.maximum = value
+        else:
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+        self.count += 1
+        self.total += value
+        self.last = value
+
+
+def _object_id(*parts: str | int) -> str:
+    """Return a statistic object ID built from slugified parts."""
+    return "_".join(re.sub(r"[^a-z0-9]+", "_", str(part).lower()).strip("_") for part in parts)
+
+
+class TornStatisticsImporter:
+    """Aggregate samples per hour and import them as external statistics.
+
+    Samples are folded into running mean/min/max buckets as data arrives.
+    When the first sample of a new hour comes in, the finished hour becomes
+    one row per statistic. Rows are imported with one call per statistic,
+    and are kept (up to a bound) while the recorder is not running yet.
+    Counters (personal stats) are imported with state and sum instead of
+    mean/min/max.
+
+    Market-wide statistics come from one importer shared by all entries;
+    player statistics from one importer per entry.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str | None = None) -> None:
+        """Initialize the importer."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self._hour: datetime | None = None
+        self._buckets: dict[str, _HourBucket] = {}
+        # Finished hours not imported yet, per statistic
+        self._pending: dict[str, tuple[StatisticMetaData, list[StatisticData]]] = {}
+        self.imported_rows = 0
+
+    def _add(self, object_id: str, name: str, unit: str | None, value: Any, counter: bool = False) -> None:
+        """Add a sample to the bucket of a statistic."""
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return
+        statistic_id = f"{DOMAIN}:{object_id}"
+        if (bucket := self._buckets.get(statistic_id)) is None:
+            bucket = self._buckets[statistic_id] = _HourBucket(name, unit, counter)
+        bucket.add(value)
+
+    @callback
+    def _async_begin(self, current_time: float) -> None:
+        """Close the previous hour when a sample of a new hour arrives."""
+        hour = datetime.fromtimestamp(current_time, tz=timezone.utc).replace(minute=0, second=0, microsecond=0)
+        if self._hour is not None and hour > self._hour:
+            self._finish_hour()
+            self._async_import()
+        self._hour = hour
+
+    @callback
+    def async_record_market(self, torn_stocks: Any, current_time: float) -> None:
+        """Sample market prices, which are the same for every account."""
+        if not isinstance(torn_stocks, dict):
+            return
+        self._async_begin(current_time)
+        for stock in torn_stocks.values():
+            self._add(_object_id("stock", stock.acronym, "price"), f"Torn stock {stock.acronym} price", "$", stock.current_price)
+
+    @callback
+    def async_record_player(self, hub: TornDataHub, fetched_keys: set[str], current_time: float) -> None:
+        """Sample the player figures among the fetched data of a hub."""
+        self._async_begin(current_time)
+
+        cache = hub._cache
+        # Player statistics are keyed by player ID, which survives reinstalling the integration
+        profile = cache.get("profile")
+        player = profile.id if profile is not None else self.entry_id
+
+        if fetched_keys & NETWORTH_DATA_KEYS:
+            networth = hub.networth
+            self._add(_object_id(player, "cash"), f"Torn {player} cash", "$", networth.cash)
+            self._add(_object_id(player, "portfolio"), f"Torn {player} portfolio", "$", networth.portfolio)
+            self._add(_object_id(player, "live_networth"), f"Torn {player} live networth", "$", networth.value)
+
+        if "personalstats" in fetched_keys and isinstance(personalstats := cache.get("personalstats"), dict):
+            battle_stats = personalstats.get("battle_stats") or {}
+            for stat in BATTLE_STATS:
+                self._add(_object_id(player, "battle", stat), f"Torn {player} battle {stat}", None, battle_stats.get(stat))
+
+        if "personalstats_extra" in fetched_keys:
+            stats = cache.get("personalstats_extra")
+            # Stats requested by name come back as a list of {name, value}
+            if isinstance(stats, list):
+                stats = {stat.get("name"): stat.get("value") for stat in stats if isinstance(stat, dict)}
+            if isinstance(stats, dict):
+                for stat, value in stats.items():
+                    self._add(_object_id(player, "stat", stat), f"Torn {player} {stat}", None, value, counter=True)
+
+    def _finish_hour(self) -> None:
+        """Turn the buckets of the finished hour into pending rows."""
+        for statistic_id, bucket in self._buckets.items():
+            if statistic_id not in self._pending:
+                metadata: StatisticMetaData = {
+                    "source": DOMAIN,
+                    "statistic_id": statistic_id,
+                    "name": bucket.name,
+                    "unit_of_measurement": bucket.unit,
+                    "has_sum": bucket.counter,
+                }
+                if StatisticMeanType is not None:
+                    metadata["mean_type"] = StatisticMeanType.NONE if bucket.counter else StatisticMeanType.ARITHMETIC
+                else:
+                    metadata["has_mean"] = not bucket.counter
+                self._pending[statistic_id] = (metadata, [])
+
+            if bucket.counter:
+                # Lifetime counters are their own running sum
+                row: StatisticData = {"start": self._hour, "state": bucket.last, "sum": bucket.last}
+            else:
+                row = {
+                    "start": self._hour,
+                    "mean": bucket.total / bucket.count,
+                    "min": bucket.minimum,
+                    "max": bucket.maximum,
+                }
+            rows = self._pending[statistic_id][1]
+            rows.append(row)
+            # Bound what is kept while the recorder is not running
+            del rows[:-STATISTICS_MAX_PENDING_HOURS]
+        self._buckets = {}
+
+    @callback
+    def _async_import(self) -> None:
+        """Import the pending rows with one call per statistic."""
+        if not self._pending or "recorder" not in self.hass.config.components:
+            return
+
+        rows_imported = 0
+        for metadata, rows in self._pending.values():
+            async_add_external_statistics(self.hass, metadata, rows)
+            rows_imported += len(rows)
+
+        self.imported_rows += rows_imported
+        _LOGGER.debug(f"Imported {rows_imported} hourly rows of {len(self._pending)} statistics")
+        self._pending = {}
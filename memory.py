@@ -0,0 +1,111 @@
+"""Memory accounting for Torn City integration."""
+from __future__ import annotations
+
+from collections import deque
+import os
+import sys
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import PACKAGE_DIR
+
+if TYPE_CHECKING:
+    from .coordinator import TornDataHub
+
+_CONTAINERS = (dict, list, tuple, set, frozenset, deque)
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Return the retained size in bytes of an object and everything it holds.
+
+    Containers and the integration's own classes are followed; any other
+    object (Home Assistant core, sessions, callbacks) counts only its shallow
+    size so shared infrastructure is not attributed to the integration.
+    Objects reachable twice are counted once.
+    """
+    seen: set[int] = set()
+    size = 0
+    pending = [obj]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, _CONTAINERS):
+            pending.extend(item)
+        elif type(item).__module__.startswith(__package__ or __name__):
+            if hasattr(item, "__dict__"):
+                pending.append(vars(item))
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    pending.append(getattr(item, slot))
+    return size
+
+
+def hub_memory_report(hass: HomeAssistant, hub: TornDataHub) -> dict[str, Any]:
+    """Return the retained size of the cache, hub structures and entity attributes."""
+    cache = {data_key: deep_sizeof(endpoint_data) for data_key, endpoint_data in hub._cache.items()}
+    structures = {
+        "cache_times": deep_sizeof(hub.cache_times),
+        "inflight": deep_sizeof(hub._inflight),
+        "stock_analytics": deep_sizeof(hub.stock_analytics),
+        "event_detector": deep_sizeof(hub.event_detector._previous),
+        "events_feed": deep_sizeof(hub.events_feed.history) if hub.events_feed else 0,
+        "client_latencies": deep_sizeof(hub.client.latencies),
+        "throttle": deep_sizeof(hub.throttle) if hub.throttle else 0,
+        # Coordinator data mostly references the cached payloads
+        **{
+            f"{coordinator.name}_data": deep_sizeof(coordinator.data)
+            for coordinator in hub.coordinators.values()
+        },
+    }
+
+    entities = {}
+    if hub.entry_id is not None:
+        for entity_entry in er.async_entries_for_config_entry(er.async_get(hass), hub.entry_id):
+            if (state := hass.states.get(entity_entry.entity_id)) is not None:
+                entities[entity_entry.entity_id] = deep_sizeof(dict(state.attributes))
+
+    return {
+        "cache": cache,
+        "structures": structures,
+        "entity_attributes": dict(sorted(entities.items(), key=lambda item: item[1], reverse=True)),
+        "total_bytes": (
+            deep_sizeof(hub._cache)
+            + sum(size for name, size in structures.items() if not name.endswith("_data"))
+            + sum(entities.values())
+        ),
+    }
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """Return a heap snapshot limited to allocations made by the integration (executor)."""
+    return tracemalloc.take_snapshot().filter_traces(
+        # Allocations are attributed to the source file that made them
+        [tracemalloc.Filter(True, os.path.join(PACKAGE_DIR, "*"))]
+    )
+
+
+def compare_snapshots(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, top: int
+) -> list[dict[str, Any]]:
+    """Return the source lines whose retained allocations grew the most."""
+    return [
+        {
+            "file": os.path.relpath(stat.traceback[0].filename, PACKAGE_DIR),
+            "line": stat.traceback[0].lineno,
+            "size_diff": stat.size_diff,
+            "count_diff": stat.count_diff,
+            "size": stat.size,
+        }
+        for stat in after.compare_to(before, "lineno")[:top]
+        if stat.size_diff > 0
+    ]
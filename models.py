@@ -0,0 +1,355 @@
+"""Typed response models for Torn City integration.
+
+Each model is a slotted, frozen dataclass. Decoders are compiled once per model
+from its type hints, and validation errors are collected per field so a
+malformed response fails at ingest with a precise message.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import MISSING, asdict, dataclass, field, fields, is_dataclass
+import types
+from typing import Any, TypeVar, Union, get_args, get_origin, get_type_hints
+
+T = TypeVar("T")
+
+Decoder = Callable[[Any, str, list[str]], Any]
+
+
+class TornDecodeError(Exception):
+    """Raised when a response does not match its model."""
+
+    def __init__(self, data_key: str, errors: list[str]) -> None:
+        """Initialize the error with per-field messages."""
+        super().__init__(f"Malformed {data_key} response: {'; '.join(errors)}")
+        self.data_key = data_key
+        self.errors = errors
+
+
+# ============================================================================
+# Models
+# ============================================================================
+
+
+@dataclass(slots=True, frozen=True)
+class Status:
+    """Player status (Okay, Hospital, Jail, Traveling, ...)."""
+
+    state: str | None = None
+    description: str | None = None
+    details: str | None = None
+    until: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class LastAction:
+    """When the player last did something (Online, Idle, Offline)."""
+
+    status: str | None = None
+    timestamp: int | None = None
+    relative: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Profile:
+    """Player profile."""
+
+    id: int
+    name: str
+    level: int
+    status: Status | None = None
+    last_action: LastAction | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Bar:
+    """A player bar (energy, nerve, happy, life)."""
+
+    current: int
+    maximum: int
+
+
+@dataclass(slots=True, frozen=True)
+class Chain:
+    """Faction chain bar."""
+
+    current: int = 0
+    maximum: int | None = field(default=None, metadata={"aliases": ("max",)})
+    timeout: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Bars:
+    """Player bars."""
+
+    energy: Bar
+    nerve: Bar
+    happy: Bar
+    life: Bar
+    chain: Chain | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class CityBank:
+    """City bank investment."""
+
+    amount: int | None = None
+    profit: int | None = None
+    duration: int | None = None
+    interest_rate: float | None = None
+    until: int | None = None
+    invested_at: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class FactionMoney:
+    """Money and points held in the faction."""
+
+    money: int | None = None
+    points: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Money:
+    """Player money and banking."""
+
+    wallet: int
+    points: int | None = None
+    company: int | None = None
+    vault: int | None = None
+    cayman_bank: int | None = None
+    city_bank: CityBank | None = None
+    faction: FactionMoney | None = None
+    daily_networth: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Travel:
+    """Travel status."""
+
+    time_left: int
+    destination: str | None = None
+    method: str | None = None
+    departed_at: int | None = None
+    arrival_at: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Cooldowns:
+    """Cooldowns in seconds remaining."""
+
+    drug: int
+    medical: int
+    booster: int
+
+
+@dataclass(slots=True, frozen=True)
+class StockBenefit:
+    """Benefit granted by owning a block of a stock."""
+
+    type: str | None = None
+    frequency: int | None = None
+    requirement: int | None = None
+    description: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Stock:
+    """Market data for a stock."""
+
+    name: str
+    acronym: str
+    current_price: float
+    market_cap: int | None = None
+    total_shares: int | None = None
+    investors: int | None = None
+    benefit: StockBenefit | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class StockDividend:
+    """Progress of an owned stock benefit."""
+
+    ready: int = 0
+    increment: int = 0
+    progress: int = 0
+    frequency: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class StockTransaction:
+    """A block of shares bought in one transaction."""
+
+    shares: int = 0
+    bought_price: float = 0
+    time_bought: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class UserStock:
+    """Shares of a stock owned by the player."""
+
+    total_shares: int = 0
+    benefit: StockDividend | None = None
+    dividend: StockDividend | None = None
+    transactions: dict[str, StockTransaction] = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class Company:
+    """Company profile."""
+
+    name: str
+    rating: int | None = None
+    daily_income: int | None = None
+    weekly_income: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class CompanyDetailed:
+    """Detailed company figures (director only)."""
+
+    company_funds: int | None = None
+    popularity: int | None = None
+    efficiency: int | None = None
+    environment: int | None = None
+    trains_available: int | None = None
+    advertising_budget: int | None = None
+
+
+# ============================================================================
+# Decoder compilation
+# ============================================================================
+
+
+def _decode_scalar(expected: type) -> Decoder:
+    """Return a decoder for int, float, str or bool."""
+
+    def decode(value: Any, path: str, errors: list[str]) -> Any:
+        # bool is a subclass of int, but a bool where a number is expected is malformed
+        if expected is float and isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        if expected is int and isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, expected) and not (expected is not bool and isinstance(value, bool)):
+            return value
+        errors.append(f"{path}: expected {expected.__name__}, got {type(value).__name__}")
+        return None
+
+    return decode
+
+
+def _decode_dict(value_decoder: Decoder) -> Decoder:
+    """Return a decoder for a dict keyed by ID."""
+
+    def decode(value: Any, path: str, errors: list[str]) -> Any:
+        # Torn returns an empty list instead of an empty object when nothing is owned
+        if value == []:
+            return {}
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected object, got {type(value).__name__}")
+            return None
+        return {str(key): value_decoder(item, f"{path}.{key}", errors) for key, item in value.items()}
+
+    return decode
+
+
+def _decoder_for(hint: Any) -> tuple[Decoder, bool]:
+    """Return the decoder for a type hint and whether None is allowed."""
+    origin = get_origin(hint)
+
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        decoder, _ = _decoder_for(args[0])
+        return decoder, True
+    if origin is dict:
+        value_decoder, _ = _decoder_for(get_args(hint)[1])
+        return _decode_dict(value_decoder), False
+    if is_dataclass(hint):
+        return _compile(hint), False
+    return _decode_scalar(hint), False
+
+
+_COMPILED: dict[type, Decoder] = {}
+
+
+def _compile(model: type[T]) -> Callable[[Any, str, list[str]], T | None]:
+    """Compile (and memoize) the decoder for a model."""
+    if model in _COMPILED:
+        return _COMPILED[model]
+
+    hints = get_type_hints(model)
+    plan = []
+    for model_field in fields(model):
+        decoder, nullable = _decoder_for(hints[model_field.name])
+        required = model_field.default is MISSING and model_field.default_factory is MISSING
+        sources = (model_field.name, *model_field.metadata.get("aliases", ()))
+        plan.append((model_field.name, sources, decoder, nullable, required))
+
+    def decode(value: Any, path: str, errors: list[str]) -> T | None:
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected object, got {type(value).__name__}")
+            return None
+
+        kwargs: dict[str, Any] = {}
+        for name, sources, decoder, nullable, required in plan:
+            raw = next((value[source] for source in sources if source in value), MISSING)
+            if raw is MISSING or raw is None:
+                if required or (raw is None and not nullable):
+                    errors.append(f"{path}.{name}: missing")
+                continue
+            kwargs[name] = decoder(raw, f"{path}.{name}", errors)
+
+        try:
+            return model(**kwargs)
+        except TypeError:
+            # Required fields were missing; already reported above
+            return None
+
+    _COMPILED[model] = decode
+    return decode
+
+
+# Models per data key. Data keys without a model stay plain (projected) dicts.
+ENDPOINT_MODELS: dict[str, Any] = {
+    "profile": Profile,
+    "bars": Bars,
+    "money": Money,
+    "travel": Travel,
+    "cooldowns": Cooldowns,
+    "torn_stocks": dict[str, Stock],
+    "user_stocks": dict[str, UserStock],
+    "company": Company,
+    "company_detailed": CompanyDetailed,
+}
+
+_ENDPOINT_DECODERS: dict[str, Decoder] = {
+    data_key: _decoder_for(model)[0] for data_key, model in ENDPOINT_MODELS.items()
+}
+
+
+def decode_endpoint(data_key: str, data: Any) -> Any:
+    """Decode an endpoint payload into its model.
+
+    Raises TornDecodeError listing every invalid field.
+    """
+    decoder = _ENDPOINT_DECODERS.get(data_key)
+    if decoder is None:
+        return data
+
+    errors: list[str] = []
+    result = decoder(data, data_key, errors)
+    if errors:
+        raise TornDecodeError(data_key, errors)
+    return result
+
+
+def to_primitive(value: Any) -> Any:
+    """Convert models back to plain JSON-compatible data."""
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, dict):
+        return {key: to_primitive(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_primitive(item) for item in value]
+    return value
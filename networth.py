@@ -0,0 +1,155 @@
+"""Networth figures derived from fetched data for Torn City integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import NETWORTH_SAVE_DELAY, NETWORTH_STORAGE_KEY, NETWORTH_STORAGE_VERSION
+from .models import Money, Stock, UserStock
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def cash_total(money: Money) -> int:
+    """Return all money held in wallet, vault, banks, company and faction."""
+    return (
+        money.wallet
+        + (money.vault or 0)
+        + (money.cayman_bank or 0)
+        + (money.company or 0)
+        + ((money.city_bank.amount or 0) if money.city_bank else 0)
+        + ((money.faction.money or 0) if money.faction else 0)
+    )
+
+
+def portfolio_value(user_stocks: dict[str, UserStock], torn_stocks: dict[str, Stock]) -> int:
+    """Return the value of all owned shares at the current market price."""
+    return round(
+        sum(
+            user_stock.total_shares * stock.current_price
+            for stock_id, user_stock in user_stocks.items()
+            if (stock := torn_stocks.get(stock_id)) is not None
+        )
+    )
+
+
+class TornNetworthEstimator:
+    """Live networth between the official daily snapshots.
+
+    Cash and stock holdings are known live. Everything else in the official
+    figure (items, properties, points, ...) is taken as the difference
+    between the daily networth and the live figures at the moment a new
+    daily value arrives, and kept constant until the next one. That basis
+    persists across restarts, so a reload does not reconcile again with a
+    daily value that is already hours old.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant | None = None,
+        entry_id: str | None = None,
+        expects_portfolio: bool = False,
+    ) -> None:
+        """Initialize an empty estimate."""
+        self._store: Store[dict[str, Any]] | None = (
+            Store(hass, NETWORTH_STORAGE_VERSION, f"{NETWORTH_STORAGE_KEY}.{entry_id}")
+            if hass is not None and entry_id is not None
+            else None
+        )
+        self._loaded = False
+        # Stock holdings are fetched, so wait for them before reconciling
+        self.expects_portfolio = expects_portfolio
+        self.cash: int | None = None
+        self.portfolio: int | None = None
+        self.daily_networth: int | None = None
+        self.other_assets: int | None = None
+        # Whether other_assets was computed with the portfolio subtracted
+        self.portfolio_included: bool | None = None
+        self.reconciled_at: float | None = None
+        # Daily networth of the latest money data, which may not be reconciled yet
+        self._latest_daily: int | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    async def async_load(self) -> None:
+        """Load the reconciliation basis from disk (only once)."""
+        if self._loaded or self._store is None:
+            return
+        self._loaded = True
+
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        self.daily_networth = stored.get("daily_networth")
+        self.other_assets = stored.get("other_assets")
+        self.portfolio_included = stored.get("portfolio_included")
+        self.reconciled_at = stored.get("reconciled_at")
+        _LOGGER.debug(f"Loaded live networth basis from daily networth {self.daily_networth}")
+
+    @property
+    def value(self) -> int | None:
+        """Return the estimated networth."""
+        if self.cash is None or self.other_assets is None:
+            return None
+        # The basis subtracted holdings that are not known yet
+        if self.portfolio_included and self.portfolio is None:
+            return None
+        return self.cash + (self.portfolio or 0) + self.other_assets
+
+    @callback
+    def async_update(
+        self,
+        money: Money | None,
+        user_stocks: dict[str, UserStock] | None,
+        torn_stocks: dict[str, Stock] | None,
+        current_time: float,
+    ) -> None:
+        """Recompute the estimate from the latest inputs."""
+        previous = self.value
+        if isinstance(money, Money):
+            self.cash = cash_total(money)
+            self._latest_daily = money.daily_networth
+        daily_networth = self._latest_daily
+
+        portfolio = portfolio_value(user_stocks, torn_stocks) if user_stocks is not None and torn_stocks else None
+        self.portfolio = portfolio
+        # Holdings appearing or disappearing would otherwise shift the other assets
+        reconcile = (
+            daily_networth != self.daily_networth
+            or self.portfolio_included is None
+            or self.portfolio_included != (portfolio is not None)
+        )
+        waiting_for_portfolio = self.expects_portfolio and portfolio is None
+
+        if reconcile and not waiting_for_portfolio and daily_networth is not None and self.cash is not None:
+            self.daily_networth = daily_networth
+            self.other_assets = daily_networth - self.cash - (portfolio or 0)
+            self.portfolio_included = portfolio is not None
+            self.reconciled_at = current_time
+            _LOGGER.debug(f"Reconciled live networth with daily networth {daily_networth}, other assets {self.other_assets}")
+            if self._store is not None:
+                self._store.async_delay_save(self._data_to_save, NETWORTH_SAVE_DELAY)
+
+        if self.value != previous:
+            for listener in list(self._listeners):
+                listener()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "daily_networth": self.daily_networth,
+            "other_assets": self.other_assets,
+            "portfolio_included": self.portfolio_included,
+            "reconciled_at": self.reconciled_at,
+        }
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call a listener when the estimate changes; return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
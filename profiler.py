@@ -0,0 +1,81 @@
+"""On-demand CPU profiling of coordinator cycles for Torn City integration."""
+from __future__ import annotations
+
+import cProfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+import os
+import pstats
+from typing import Any
+
+from .const import PACKAGE_DIR
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TornCycleProfiler:
+    """cProfile recorder for the next coordinator cycles.
+
+    The profiler is only enabled around the synchronous work of a cycle
+    (decoding, derived computations and the entity updates they trigger), so
+    time spent awaiting the network and unrelated tasks on the event loop are
+    not recorded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._profile = cProfile.Profile()
+        self._active = False
+        self._warned = False
+
+    def check_available(self) -> None:
+        """Raise ValueError when another profiler is already running."""
+        self._profile.enable()
+        self._profile.disable()
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Record the code run inside the block."""
+        # Nested blocks are already covered by the outer one
+        if self._active:
+            yield
+            return
+        try:
+            self._profile.enable()
+        except ValueError as err:
+            # Another profiler was started since (Python 3.12+); never fail the cycle
+            if not self._warned:
+                _LOGGER.warning(f"Profiling skipped, another profiler is running: {err}")
+                self._warned = True
+            yield
+            return
+        self._active = True
+        try:
+            yield
+        finally:
+            self._profile.disable()
+            self._active = False
+
+    def save(self, path: str) -> None:
+        """Write the profile in pstats format (executor)."""
+        self._profile.dump_stats(path)
+
+    def summary(self, top: int) -> list[dict[str, Any]]:
+        """Return the integration's functions with the most internal time."""
+        stats = pstats.Stats(self._profile)
+        rows = [
+            {
+                "function": function,
+                "file": os.path.relpath(filename, PACKAGE_DIR),
+                "line": line,
+                "calls": calls,
+                "total_time": round(total_time, 6),
+                "cumulative_time": round(cumulative_time, 6),
+            }
+            for (filename, line, function), (_, calls, total_time, cumulative_time, _) in stats.stats.items()
+            # Functions defined in the package directory are the integration's own code
+            if filename.startswith(PACKAGE_DIR)
+        ]
+        rows.sort(key=lambda row: row["total_time"], reverse=True)
+        return rows[:top]
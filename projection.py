@@ -0,0 +1,31 @@
+"""Field projection of Torn API payloads."""
+from __future__ import annotations
+
+from typing import Any
+
+# A projection schema is either True (keep the value as is) or a dict mapping
+# field names to nested schemas. The special key "*" applies a schema to every
+# value of a dict keyed by ID (stocks, transactions, ...). Lists are projected
+# element by element.
+Schema = dict[str, Any] | bool
+
+
+def project(data: Any, schema: Schema) -> Any:
+    """Return a copy of data containing only the fields in schema."""
+    if schema is True:
+        return data
+
+    if isinstance(data, list):
+        return [project(item, schema) for item in data]
+
+    if not isinstance(data, dict):
+        return data
+
+    if "*" in schema:
+        return {key: project(value, schema["*"]) for key, value in data.items()}
+
+    return {
+        field: project(data[field], sub_schema)
+        for field, sub_schema in schema.items()
+        if field in data
+    }
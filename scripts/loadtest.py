@@ -0,0 +1,318 @@
+"""Load test for the Torn City integration.
+
+Starts a real Home Assistant instance in a temporary config directory with N
+Torn config entries. Every entry polls a local stand-in for api.torn.com, and
+the script samples, once per interval:
+
+- event loop lag (how late a 100 ms sleep wakes up)
+- CPU seconds used per wall-clock second
+- state writes per second
+- resident memory
+
+Usage (from the repository root, with Home Assistant installed):
+
+    python scripts/loadtest.py --entries 50 --duration 120
+    python scripts/loadtest.py --entries 1 10 50 100 --json results.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import os
+from pathlib import Path
+import random
+import resource
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant import bootstrap, runner
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DOMAIN = "torn"
+LAG_PROBE_INTERVAL = 0.1
+# Simulated key "loadtest-<n>" belongs to player PLAYER_ID_BASE + n, so every entry is a distinct account
+PLAYER_ID_BASE = 3_000_000
+
+_LOGGER = logging.getLogger("loadtest")
+
+
+# ============================================================================
+# Stand-in Torn API
+# ============================================================================
+
+
+def _bar(maximum: int) -> dict[str, int]:
+    """Return a bar with a random current value."""
+    return {"current": random.randint(0, maximum), "maximum": maximum}
+
+
+def _user_payload(selection: str, user_id: int) -> dict[str, Any]:
+    """Return a plausible payload for a user selection."""
+    now = int(time.time())
+    payloads: dict[str, Any] = {
+        "profile": {
+            "id": user_id,
+            "name": f"Player{user_id}",
+            "level": 50,
+            "status": {"state": "Okay", "description": "Okay", "details": None, "until": 0},
+            "last_action": {"status": "Online", "timestamp": now - random.randint(0, 120), "relative": "1 minute ago"},
+        },
+        "basic": {"id": user_id, "name": f"Player{user_id}", "level": 50},
+        "bars": {
+            "energy": _bar(150),
+            "nerve": _bar(60),
+            "happy": _bar(5000),
+            "life": _bar(2500),
+            "chain": {"current": 0, "max": 10, "timeout": 0},
+        },
+        "money": {
+            "points": 100,
+            "wallet": random.randint(0, 10_000_000),
+            "company": 0,
+            "vault": 1_000_000,
+            "cayman_bank": 0,
+            "city_bank": {"amount": 0, "profit": 0, "duration": 0, "interest_rate": 0, "until": 0, "invested_at": 0},
+            "faction": {"money": 0, "points": 0},
+            "daily_networth": 50_000_000,
+        },
+        "travel": {"destination": "Torn", "method": "Standard", "departed_at": 0, "arrival_at": 0, "time_left": 0},
+        "cooldowns": {"drug": random.randint(0, 3600), "medical": 0, "booster": 0},
+        "personalstats": {"battle_stats": {"strength": 1000, "defense": 1000, "speed": 1000, "dexterity": 1000, "total": 4000}},
+        "skills": [{"slug": "reviving", "name": "Reviving", "level": 10}],
+        "log": [
+            {
+                "id": f"{user_id}-{now}",
+                "timestamp": now,
+                "details": {"id": 1, "title": "Gym train", "category": "Gym"},
+                "data": {},
+                "params": {},
+            }
+        ],
+        "events": [{"id": f"{user_id}-{now // 60}", "timestamp": now // 60 * 60, "event": "Someone sent you a message"}],
+    }
+    # /user/basic answers under "profile", which the config flow reads the player ID from
+    if selection == "basic":
+        return {"profile": payloads["basic"]}
+    return {selection: payloads.get(selection, {})}
+
+
+def _stocks_payload() -> dict[str, Any]:
+    """Return the market for all stocks."""
+    return {
+        "stocks": {
+            str(stock_id): {
+                "name": f"Stock {stock_id}",
+                "acronym": f"S{stock_id}",
+                "current_price": round(random.uniform(100, 1000), 2),
+                "market_cap": 1_000_000_000,
+                "total_shares": 10_000_000,
+                "investors": 1000,
+                "benefit": {"type": "active", "frequency": 7, "requirement": 100_000, "description": "$1,000,000"},
+            }
+            for stock_id in range(1, 36)
+        }
+    }
+
+
+def create_stand_in_api(latency: float, rate_limit_errors: float) -> web.Application:
+    """Return an aiohttp app that answers like api.torn.com."""
+
+    async def handle(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency * random.uniform(0.5, 1.5))
+        if random.random() < rate_limit_errors:
+            return web.json_response({"error": {"code": 5, "error": "Too many requests"}})
+
+        key = request.headers.get("Authorization", "").removeprefix("ApiKey ") or request.query.get("key", "")
+        suffix = key.rsplit("-", 1)[-1]
+        user_id = PLAYER_ID_BASE + (int(suffix) if suffix.isdigit() else 0)
+        parts = [part for part in request.path.split("/") if part and part != "v2"]
+        section = parts[0]
+        selection = parts[1] if len(parts) > 1 else request.query.get("selections", "profile")
+
+        if section == "key":
+            user_sections = ["profile", "basic", "bars", "money", "travel", "cooldowns", "personalstats",
+                             "skills", "log", "events", "refills", "stocks"]
+            return web.json_response(
+                {"info": {"selections": {"user": user_sections, "torn": ["stocks", "items"], "company": ["profile", "detailed"]}}}
+            )
+        if section == "torn" and selection == "stocks":
+            return web.json_response(_stocks_payload())
+        if section == "torn" and selection == "items":
+            return web.json_response({"items": {str(item_id): {"name": f"Item {item_id}", "market_value": item_id * 100} for item_id in range(1, 1200)}})
+        if section == "user" and selection == "stocks":
+            return web.json_response({"stocks": {"1": {"total_shares": 1000, "transactions": {}}}})
+        if section == "user" and selection == "refills":
+            return web.json_response({"refills": {"energy_refill_used": False, "nerve_refill_used": False, "token_refill_used": False}})
+        if section == "company":
+            return web.json_response({"company": {"name": "Company", "rating": 5, "daily_income": 1000, "weekly_income": 7000}})
+        return web.json_response(_user_payload(selection, user_id))
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    return app
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+
+def _rss_bytes() -> int:
+    """Return the resident set size of this process."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss is the peak, in kilobytes on Linux and bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+async def _probe_loop_lag(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late the event loop wakes up from a short sleep."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        lags.append(max(0.0, loop.time() - started - LAG_PROBE_INTERVAL))
+
+
+async def run_scenario(entries: int, duration: float, interval: float, latency: float, rate_limit_errors: float) -> dict[str, Any]:
+    """Run one load test with the given number of entries and return its samples."""
+    server = web.AppRunner(create_stand_in_api(latency, rate_limit_errors))
+    await server.setup()
+    site = web.TCPSite(server, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+
+    with tempfile.TemporaryDirectory(prefix="torn-loadtest-") as config_dir:
+        custom_components = Path(config_dir, "custom_components")
+        custom_components.mkdir()
+        Path(custom_components, DOMAIN).symlink_to(REPO_ROOT, target_is_directory=True)
+        Path(config_dir, "configuration.yaml").write_text("homeassistant:\n", encoding="utf-8")
+
+        hass: HomeAssistant = await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(config_dir=config_dir, skip_pip=True)
+        )
+        await hass.async_start()
+
+        # Point the client at the stand-in server
+        importlib.import_module(f"custom_components.{DOMAIN}.api").API_BASE_URL = f"http://127.0.0.1:{port}"
+
+        state_writes = 0
+
+        def count_write(_event: Any) -> None:
+            nonlocal state_writes
+            state_writes += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+
+        setup_started = time.monotonic()
+        for index in range(1, entries + 1):
+            await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": "user"},
+                data={"api_key": f"loadtest-{index}", "throttle_api": False},
+            )
+        await hass.async_block_till_done()
+        setup_seconds = time.monotonic() - setup_started
+        loaded = sum(
+            entry.state is ConfigEntryState.LOADED for entry in hass.config_entries.async_entries(DOMAIN)
+        )
+        # A row is only meaningful if every simulated account is actually running
+        if loaded != entries:
+            await hass.async_stop()
+            await server.cleanup()
+            raise RuntimeError(f"Only {loaded} of {entries} config entries loaded")
+
+        lags: list[float] = []
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(_probe_loop_lag(lags, stop))
+
+        samples: list[dict[str, Any]] = []
+        rss_start = _rss_bytes()
+        started = time.monotonic()
+        while time.monotonic() - started < duration:
+            cpu_before, writes_before, wall_before = time.process_time(), state_writes, time.monotonic()
+            lag_count = len(lags)
+            await asyncio.sleep(interval)
+            wall = time.monotonic() - wall_before
+            window = lags[lag_count:] or [0.0]
+            samples.append({
+                "t": round(time.monotonic() - started, 1),
+                "lag_p50_ms": round(statistics.median(window) * 1000, 2),
+                "lag_max_ms": round(max(window) * 1000, 2),
+                "cpu_per_s": round((time.process_time() - cpu_before) / wall, 3),
+                "writes_per_s": round((state_writes - writes_before) / wall, 1),
+                "rss_mb": round(_rss_bytes() / 1_048_576, 1),
+            })
+            _LOGGER.info(f"entries={entries} {samples[-1]}")
+
+        stop.set()
+        await lag_task
+        await hass.async_stop()
+
+    await server.cleanup()
+
+    ordered = sorted(lags) or [0.0]
+    return {
+        "entries": entries,
+        "loaded_entries": loaded,
+        "setup_seconds": round(setup_seconds, 2),
+        "lag_p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+        "lag_p99_ms": round(ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)] * 1000, 2),
+        "lag_max_ms": round(ordered[-1] * 1000, 2),
+        "cpu_per_s": round(statistics.mean(sample["cpu_per_s"] for sample in samples), 3),
+        "writes_per_s": round(statistics.mean(sample["writes_per_s"] for sample in samples), 1),
+        "rss_growth_mb": round((_rss_bytes() - rss_start) / 1_048_576, 1),
+        "samples": samples,
+    }
+
+
+def main() -> None:
+    """Parse arguments and run the scenarios."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 50, 100], help="config entries per scenario (1-100)")
+    parser.add_argument("--duration", type=float, default=60, help="seconds to measure per scenario")
+    parser.add_argument("--interval", type=float, default=5, help="seconds per sample")
+    parser.add_argument("--latency", type=float, default=0.05, help="mean stand-in API latency in seconds")
+    parser.add_argument("--rate-limit-errors", type=float, default=0.0, help="fraction of requests answered with error code 5")
+    parser.add_argument("--json", type=Path, help="write all results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    logging.getLogger("homeassistant").setLevel(logging.WARNING)
+
+    results = []
+    for entries in args.entries:
+        if not 1 <= entries <= 100:
+            parser.error("--entries must be between 1 and 100")
+        try:
+            results.append(
+                asyncio.run(run_scenario(entries, args.duration, args.interval, args.latency, args.rate_limit_errors))
+            )
+        except RuntimeError as err:
+            raise SystemExit(f"Load test with {entries} entries failed: {err}") from err
+
+    print(f"{'entries':>8} {'setup s':>8} {'lag p50':>8} {'lag p99':>8} {'lag max':>8} {'cpu/s':>6} {'writes/s':>9} {'rss +MB':>8}")
+    for result in results:
+        print(
+            f"{result['entries']:>8} {result['setup_seconds']:>8} {result['lag_p50_ms']:>8} {result['lag_p99_ms']:>8} "
+            f"{result['lag_max_ms']:>8} {result['cpu_per_s']:>6} {result['writes_per_s']:>9} {result['rss_growth_mb']:>8}"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
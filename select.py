@@ -0,0 +1,91 @@
+"""Select platform for Torn City integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.select import SelectEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from .const import DOMAIN, POLLING_PROFILES
+from .coordinator import TornDataHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Torn City selects from a config entry."""
+    hub: TornDataHub = hass.data[DOMAIN][entry.entry_id]["hub"]
+
+    async_add_entities([TornPollingProfileSelect(hub, entry)])
+
+
+class TornPollingProfileSelect(SelectEntity, RestoreEntity):
+    """Select for the active polling profile.
+
+    Switching applies new update intervals to the running coordinators
+    without reloading the entry. The choice is restored after a restart.
+    """
+
+    _attr_icon = "mdi:speedometer"
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_should_poll = False
+    _attr_options = list(POLLING_PROFILES)
+
+    def __init__(self, hub: TornDataHub, entry: ConfigEntry) -> None:
+        """Initialize the select."""
+        self.hub = hub
+        self.entry = entry
+        self._attr_has_entity_name = True
+
+        # Set up device info
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Torn",
+            manufacturer="Torn City",
+            model="Player Account",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{self.entry.entry_id}_polling_profile"
+
+    @property
+    def name(self) -> str:
+        """Return select name."""
+        return "Polling Profile"
+
+    @property
+    def current_option(self) -> str:
+        """Return the active polling profile."""
+        return self.hub.polling_profile
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the update interval of each tier in seconds."""
+        return {
+            coordinator.name: coordinator.update_interval.total_seconds()
+            for coordinator in self.hub.coordinators.values()
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last polling profile and follow changes."""
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) and last_state.state in POLLING_PROFILES:
+            self.hub.async_set_polling_profile(last_state.state)
+        self.async_on_remove(self.hub.async_add_profile_listener(self.async_write_ha_state))
+
+    async def async_select_option(self, option: str) -> None:
+        """Switch the polling profile."""
+        self.hub.async_set_polling_profile(option)
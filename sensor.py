@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import partial
 import logging
+import re
+from time import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -11,13 +14,26 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 
-from .const import DOMAIN
-from .coordinator import TornDataUpdateCoordinator
+from .const import (
+    CONF_COUNTDOWN_RESOLUTION,
+    CONF_HOUSEHOLD,
+    CONF_PERSONALSTATS_EXTRA,
+    COUNTDOWN_RESOLUTIONS,
+    DEFAULT_COUNTDOWN_RESOLUTION,
+    DOMAIN,
+    parse_stat_list,
+)
+from .coordinator import TornDataHub, TornDataUpdateCoordinator
+from .events import chain_timeout_at
+from .household import TornHousehold
+from .models import Stock
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,20 +44,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Torn City sensors from a config entry."""
-    coordinator: TornDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
-        "coordinator"
-    ]
+    hub: TornDataHub = hass.data[DOMAIN][entry.entry_id]["hub"]
 
     # Helper function to check if endpoint is enabled
     def is_endpoint_enabled(key: str) -> bool:
         """Check if an endpoint is enabled."""
-        return key in coordinator.enabled_data_keys
+        return key in hub.enabled_data_keys
 
     # Create flat sensor entities
     entities: list[SensorEntity] = []
 
     # Profile & Battle stats sensors (always enabled - core endpoints)
     if is_endpoint_enabled("profile"):
+        coordinator = hub.coordinator_for("profile")
         entities.extend([
             TornProfileNameSensor(coordinator, entry),
             TornProfileLevelSensor(coordinator, entry),
@@ -49,6 +64,12 @@ async def async_setup_entry(
             TornProfileStatusDescriptionSensor(coordinator, entry),
             TornProfileStatusDetailsSensor(coordinator, entry),
             TornProfileStatusUntilSensor(coordinator, entry),
+            TornProfileLastActionSensor(coordinator, entry),
+        ])
+
+    if is_endpoint_enabled("personalstats"):
+        coordinator = hub.coordinator_for("personalstats")
+        entities.extend([
             TornBattleStatsStrengthSensor(coordinator, entry),
             TornBattleStatsDefenseSensor(coordinator, entry),
             TornBattleStatsSpeedSensor(coordinator, entry),
@@ -56,8 +77,15 @@ async def async_setup_entry(
             TornBattleStatsTotalSensor(coordinator, entry),
         ])
 
+    # Extra personal stats selected in options
+    if is_endpoint_enabled("personalstats_extra"):
+        coordinator = hub.coordinator_for("personalstats_extra")
+        for stat in parse_stat_list(entry.options.get(CONF_PERSONALSTATS_EXTRA)):
+            entities.append(TornPersonalStatSensor(coordinator, entry, stat))
+
     # Bars sensors (always enabled - core endpoints)
     if is_endpoint_enabled("bars"):
+        coordinator = hub.coordinator_for("bars")
         entities.extend([
             TornBarsEnergySensor(coordinator, entry),
             TornBarsNerveSensor(coordinator, entry),
@@ -69,6 +97,7 @@ async def async_setup_entry(
 
     # Cooldowns sensors
     if is_endpoint_enabled("cooldowns"):
+        coordinator = hub.coordinator_for("cooldowns")
         entities.extend([
             TornCooldownsDrugSensor(coordinator, entry),
             TornCooldownsMedicalSensor(coordinator, entry),
@@ -77,6 +106,7 @@ async def async_setup_entry(
 
     # Money sensors
     if is_endpoint_enabled("money"):
+        coordinator = hub.coordinator_for("money")
         entities.extend([
             TornMoneyPointsSensor(coordinator, entry),
             TornMoneyWalletSensor(coordinator, entry),
@@ -92,10 +122,12 @@ async def async_setup_entry(
             TornMoneyFactionSensor(coordinator, entry),
             TornMoneyFactionPointsSensor(coordinator, entry),
             TornMoneyDailyNetworthSensor(coordinator, entry),
+            TornMoneyLiveNetworthSensor(coordinator, entry),
         ])
 
     # Travel sensors
     if is_endpoint_enabled("travel"):
+        coordinator = hub.coordinator_for("travel")
         entities.extend([
             TornTravelDestinationSensor(coordinator, entry),
             TornTravelMethodSensor(coordinator, entry),
@@ -106,10 +138,17 @@ async def async_setup_entry(
 
     # Log sensor
     if is_endpoint_enabled("log"):
+        coordinator = hub.coordinator_for("log")
         entities.append(TornLogLatestSensor(coordinator, entry))
 
+    # Events feed sensor
+    if is_endpoint_enabled("events"):
+        coordinator = hub.coordinator_for("events")
+        entities.append(TornEventsLatestSensor(coordinator, entry))
+
     # Company sensors
     if is_endpoint_enabled("company") or is_endpoint_enabled("company_detailed"):
+        coordinator = hub.coordinator_for("company" if is_endpoint_enabled("company") else "company_detailed")
         entities.extend([
             TornCompanyFundsSensor(coordinator, entry),
             TornCompanyPopularitySensor(coordinator, entry),
@@ -123,26 +162,52 @@ async def async_setup_entry(
             TornCompanyWeeklyIncomeSensor(coordinator, entry),
         ])
 
+    # Adaptive API rate sensor
+    entities.append(TornApiRateSensor(hub.coordinator_for("profile"), entry))
+
+    # Item catalog sensor
+    if is_endpoint_enabled("items"):
+        coordinator = hub.coordinator_for("items")
+        entities.append(TornItemCatalogSensor(coordinator, entry))
+
     # Add dynamic skill sensors
-    if is_endpoint_enabled("skills") and coordinator.data and "skills" in coordinator.data:
-        skills = coordinator.data["skills"]
+    if is_endpoint_enabled("skills"):
+        coordinator = hub.coordinator_for("skills")
+        skills = coordinator.data.get("skills") if coordinator.data else None
         if skills and isinstance(skills, list):
             for skill in skills:
                 entities.append(TornSkillSensor(coordinator, entry, skill))
 
     # Add dynamic stock sensors (all 35 stocks)
     if is_endpoint_enabled("torn_stocks") and is_endpoint_enabled("user_stocks"):
+        coordinator = hub.coordinator_for("torn_stocks")
         if coordinator.data and "torn_stocks" in coordinator.data:
             torn_stocks = coordinator.data["torn_stocks"]
             _LOGGER.info(f"Creating stock sensors. Found {len(torn_stocks) if torn_stocks else 0} stocks in torn_stocks")
             if torn_stocks and isinstance(torn_stocks, dict):
                 for stock_id, stock_data in torn_stocks.items():
-                    _LOGGER.debug(f"Creating TornStockSensor for stock_id={stock_id}, name={stock_data.get('name', 'Unknown')}")
+                    _LOGGER.debug(f"Creating TornStockSensor for stock_id={stock_id}, name={stock_data.name}")
                     entities.append(TornStockSensor(coordinator, entry, stock_id, stock_data))
+                entities.append(TornStockBestRoiSensor(coordinator, entry))
                 _LOGGER.info(f"Created {len([e for e in entities if isinstance(e, TornStockSensor)])} stock sensors")
         else:
             _LOGGER.debug(f"Stocks endpoint enabled but no torn_stocks data found. coordinator.data keys: {list(coordinator.data.keys()) if coordinator.data else 'None'}")
 
+    # Household totals across all loaded accounts, owned by a single entry
+    # because their unique IDs are not per entry
+    if entry.options.get(CONF_HOUSEHOLD, False):
+        owner = hass.data[DOMAIN].setdefault("household_owner", entry.entry_id)
+        if owner == entry.entry_id:
+            entry.async_on_unload(partial(hass.data[DOMAIN].pop, "household_owner", None))
+            household: TornHousehold = hass.data[DOMAIN]["household"]
+            entities.extend([
+                TornHouseholdCashSensor(household),
+                TornHouseholdNetworthSensor(household),
+                TornHouseholdPortfolioSensor(household),
+            ])
+        else:
+            _LOGGER.warning(f"Household totals are already shown by entry {owner}, skipping them for {entry.title}")
+
     _LOGGER.info(f"Created {len(entities)} sensors based on enabled endpoints")
     async_add_entities(entities)
 
@@ -175,6 +240,94 @@ class TornSensor(CoordinatorEntity[TornDataUpdateCoordinator], SensorEntity):
         return self.coordinator.last_update_success and self.coordinator.data is not None
 
 
+class TornCountdownSensor(TornSensor):
+    """Base class for sensors computed from an absolute target timestamp.
+
+    The state is derived from the target and the current time, and state
+    writes are scheduled locally at the boundaries that matter (zero, and
+    every second or minute for ticking sensors) instead of waiting for the
+    next API fetch.
+    """
+
+    # Write the state on every resolution boundary, not only when the target is reached
+    _tick = False
+    # Clear the state once the target has passed
+    _clear_on_expiry = True
+
+    def __init__(
+        self,
+        coordinator: TornDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the countdown sensor."""
+        super().__init__(coordinator, entry)
+        self._unsub_countdown: CALLBACK_TYPE | None = None
+
+    def _target_timestamp(self) -> float | None:
+        """Return the absolute Unix timestamp this sensor counts down to."""
+        raise NotImplementedError
+
+    @property
+    def native_value(self) -> datetime | int | None:
+        """Return the target as timestamp."""
+        target = self._target_timestamp()
+        if target is None or (self._clear_on_expiry and target <= time()):
+            return None
+        return datetime.fromtimestamp(target, tz=timezone.utc)
+
+    async def async_added_to_hass(self) -> None:
+        """Start the local countdown when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_countdown)
+        self._schedule_countdown()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Reschedule the countdown when new data arrives."""
+        self._schedule_countdown()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _cancel_countdown(self) -> None:
+        """Cancel the scheduled state write."""
+        if self._unsub_countdown is not None:
+            self._unsub_countdown()
+            self._unsub_countdown = None
+
+    @callback
+    def _schedule_countdown(self) -> None:
+        """Schedule the next state write at the next boundary."""
+        self._cancel_countdown()
+
+        target = self._target_timestamp()
+        if target is None:
+            return
+        remaining = target - time()
+        if remaining <= 0:
+            return
+
+        delay = remaining
+        if self._tick:
+            step = COUNTDOWN_RESOLUTIONS[
+                self.entry.options.get(CONF_COUNTDOWN_RESOLUTION, DEFAULT_COUNTDOWN_RESOLUTION)
+            ]
+            # Next point where the remaining time is a whole number of steps
+            delay = min(remaining % step or step, remaining)
+
+        self._unsub_countdown = async_track_point_in_utc_time(
+            self.hass,
+            self._countdown_tick,
+            datetime.now(timezone.utc) + timedelta(seconds=delay),
+        )
+
+    @callback
+    def _countdown_tick(self, _now: datetime) -> None:
+        """Write the state at a countdown boundary and schedule the next one."""
+        self._unsub_countdown = None
+        self.async_write_ha_state()
+        self._schedule_countdown()
+
+
 # ============================================================================
 # Profile Sensors
 # ============================================================================
@@ -198,8 +351,8 @@ class TornProfileNameSensor(TornSensor):
     @property
     def native_value(self) -> str | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("profile", {}).get("name")
+        if self.coordinator.data and (profile := self.coordinator.data.get("profile")):
+            return profile.name
         return None
 
 
@@ -222,8 +375,8 @@ class TornProfileLevelSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("profile", {}).get("level")
+        if self.coordinator.data and (profile := self.coordinator.data.get("profile")):
+            return profile.level
         return None
 
 
@@ -245,11 +398,9 @@ class TornProfileStatusSensor(TornSensor):
     @property
     def native_value(self) -> str | None:
         """Return the state."""
-        if self.coordinator.data:
-            status = self.coordinator.data.get("profile", {}).get("status", {})
-            if isinstance(status, dict):
-                return status.get("state") or status.get("description")
-            return str(status)
+        if self.coordinator.data and (profile := self.coordinator.data.get("profile")):
+            if profile.status:
+                return profile.status.state or profile.status.description
         return None
 
 
@@ -271,9 +422,9 @@ class TornProfileStatusDescriptionSensor(TornSensor):
     @property
     def native_value(self) -> str | None:
         """Return the state."""
-        if self.coordinator.data:
-            status = self.coordinator.data.get("profile", {}).get("status", {})
-            return status.get("description")
+        if self.coordinator.data and (profile := self.coordinator.data.get("profile")):
+            if profile.status:
+                return profile.status.description
         return None
 
 
@@ -295,13 +446,13 @@ class TornProfileStatusDetailsSensor(TornSensor):
     @property
     def native_value(self) -> str | None:
         """Return the state."""
-        if self.coordinator.data:
-            status = self.coordinator.data.get("profile", {}).get("status", {})
-            return status.get("details")
+        if self.coordinator.data and (profile := self.coordinator.data.get("profile")):
+            if profile.status:
+                return profile.status.details
         return None
 
 
-class TornProfileStatusUntilSensor(TornSensor):
+class TornProfileStatusUntilSensor(TornCountdownSensor):
     """Sensor for player status until timestamp."""
 
     _attr_icon = "mdi:clock-end"
@@ -317,16 +468,49 @@ class TornProfileStatusUntilSensor(TornSensor):
         """Return sensor name."""
         return "Profile Status Until"
 
+    def _target_timestamp(self) -> float | None:
+        """Return when the current status ends."""
+        if self.coordinator.data and (profile := self.coordinator.data.get("profile")):
+            until = profile.status.until if profile.status else None
+            if until and until > 0:
+                return until
+        return None
+
+
+class TornProfileLastActionSensor(TornSensor):
+    """Sensor for the player's last action timestamp."""
+
+    _attr_icon = "mdi:account-clock"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{self.entry.entry_id}_profile_last_action"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "Profile Last Action"
+
     @property
     def native_value(self) -> datetime | None:
         """Return the state."""
-        if self.coordinator.data:
-            status = self.coordinator.data.get("profile", {}).get("status", {})
-            until = status.get("until")
-            if until and until > 0:
-                return datetime.fromtimestamp(until, tz=timezone.utc)
+        if self.coordinator.data and (profile := self.coordinator.data.get("profile")):
+            timestamp = profile.last_action.timestamp if profile.last_action else None
+            if timestamp:
+                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
         return None
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return online state and whether polling is slowed down."""
+        attributes: dict[str, Any] = {"polling_slowed": self.coordinator.hub.player_idle}
+        if self.coordinator.data and (profile := self.coordinator.data.get("profile")):
+            if profile.last_action:
+                attributes["status"] = profile.last_action.status
+        return attributes
+
 
 # ============================================================================
 # Battle Stats Sensors
@@ -473,6 +657,48 @@ class TornBattleStatsTotalSensor(TornSensor):
         return None
 
 
+class TornPersonalStatSensor(TornSensor):
+    """Sensor for a user-selected personal stat."""
+
+    _attr_icon = "mdi:chart-box"
+    # Personal stats are lifetime counters that only go up
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(
+        self,
+        coordinator: TornDataUpdateCoordinator,
+        entry: ConfigEntry,
+        stat: str,
+    ) -> None:
+        """Initialize the personal stat sensor."""
+        super().__init__(coordinator, entry)
+        self.stat = stat
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{self.entry.entry_id}_personalstats_{self.stat}"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return f"PersonalStats {self.stat}"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the state."""
+        if self.coordinator.data:
+            stats = self.coordinator.data.get("personalstats_extra")
+            # Stats requested by name come back as a list of {name, value}
+            if isinstance(stats, list):
+                for stat in stats:
+                    if stat.get("name") == self.stat:
+                        return stat.get("value")
+            elif isinstance(stats, dict):
+                return stats.get(self.stat)
+        return None
+
+
 # ============================================================================
 # Bars Sensors
 # ============================================================================
@@ -497,19 +723,17 @@ class TornBarsEnergySensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            energy = self.coordinator.data.get("bars", {}).get("energy", {})
-            return energy.get("current")
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
+            return bars.energy.current
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        if self.coordinator.data:
-            energy = self.coordinator.data.get("bars", {}).get("energy", {})
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
             return {
-                "current": energy.get("current"),
-                "maximum": energy.get("maximum"),
+                "current": bars.energy.current,
+                "maximum": bars.energy.maximum,
             }
         return {}
 
@@ -533,19 +757,17 @@ class TornBarsNerveSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            nerve = self.coordinator.data.get("bars", {}).get("nerve", {})
-            return nerve.get("current")
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
+            return bars.nerve.current
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        if self.coordinator.data:
-            nerve = self.coordinator.data.get("bars", {}).get("nerve", {})
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
             return {
-                "current": nerve.get("current"),
-                "maximum": nerve.get("maximum"),
+                "current": bars.nerve.current,
+                "maximum": bars.nerve.maximum,
             }
         return {}
 
@@ -569,19 +791,17 @@ class TornBarsHappySensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            happy = self.coordinator.data.get("bars", {}).get("happy", {})
-            return happy.get("current")
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
+            return bars.happy.current
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        if self.coordinator.data:
-            happy = self.coordinator.data.get("bars", {}).get("happy", {})
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
             return {
-                "current": happy.get("current"),
-                "maximum": happy.get("maximum"),
+                "current": bars.happy.current,
+                "maximum": bars.happy.maximum,
             }
         return {}
 
@@ -605,19 +825,17 @@ class TornBarsLifeSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            life = self.coordinator.data.get("bars", {}).get("life", {})
-            return life.get("current")
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
+            return bars.life.current
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        if self.coordinator.data:
-            life = self.coordinator.data.get("bars", {}).get("life", {})
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
             return {
-                "current": life.get("current"),
-                "maximum": life.get("maximum"),
+                "current": bars.life.current,
+                "maximum": bars.life.maximum,
             }
         return {}
 
@@ -640,27 +858,25 @@ class TornBarsChainSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            chain = self.coordinator.data.get("bars", {}).get("chain")
-            if chain and isinstance(chain, dict):
-                return chain.get("current", 0)
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
+            if bars.chain:
+                return bars.chain.current
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        if self.coordinator.data:
-            chain = self.coordinator.data.get("bars", {}).get("chain")
-            if chain and isinstance(chain, dict):
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
+            if bars.chain:
                 return {
-                    "current": chain.get("current"),
-                    "maximum": chain.get("maximum"),
-                    "timeout": chain.get("timeout"),
+                    "current": bars.chain.current,
+                    "maximum": bars.chain.maximum,
+                    "timeout": bars.chain.timeout,
                 }
         return {}
 
 
-class TornBarsChainTimeoutSensor(TornSensor):
+class TornBarsChainTimeoutSensor(TornCountdownSensor):
     """Sensor for chain timeout timer."""
 
     _attr_icon = "mdi:timer"
@@ -676,15 +892,11 @@ class TornBarsChainTimeoutSensor(TornSensor):
         """Return sensor name."""
         return "Bars Chain Timeout"
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state as timestamp."""
-        if self.coordinator.data:
-            chain = self.coordinator.data.get("bars", {}).get("chain")
-            if chain and isinstance(chain, dict):
-                timeout = chain.get("timeout")
-                if timeout and timeout > 0:
-                    return datetime.fromtimestamp(timeout, tz=timezone.utc)
+    def _target_timestamp(self) -> float | None:
+        """Return when the chain times out."""
+        if self.coordinator.data and (bars := self.coordinator.data.get("bars")):
+            if bars.chain and bars.chain.current > 0:
+                return chain_timeout_at(bars.chain, self.coordinator.hub.cache_times.get("bars", time()))
         return None
 
 
@@ -693,7 +905,7 @@ class TornBarsChainTimeoutSensor(TornSensor):
 # ============================================================================
 
 
-class TornCooldownsDrugSensor(TornSensor):
+class TornCooldownsDrugSensor(TornCountdownSensor):
     """Sensor for drug cooldown."""
 
     _attr_icon = "mdi:pill"
@@ -709,19 +921,17 @@ class TornCooldownsDrugSensor(TornSensor):
         """Return sensor name."""
         return "Cooldowns Drug"
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state as timestamp."""
-        if self.coordinator.data:
-            seconds = self.coordinator.data.get("cooldowns", {}).get("drug", 0)
+    def _target_timestamp(self) -> float | None:
+        """Return when the cooldown ends."""
+        if self.coordinator.data and (cooldowns := self.coordinator.data.get("cooldowns")):
+            seconds = cooldowns.drug
             if seconds > 0:
                 # Use cache time to calculate stable timestamp
-                fetch_time = self.coordinator.cache_times.get("cooldowns", datetime.now(timezone.utc).timestamp())
-                return datetime.fromtimestamp(fetch_time, tz=timezone.utc).replace(microsecond=0) + timedelta(seconds=seconds)
+                return int(self.coordinator.hub.cache_times.get("cooldowns", time())) + seconds
         return None
 
 
-class TornCooldownsMedicalSensor(TornSensor):
+class TornCooldownsMedicalSensor(TornCountdownSensor):
     """Sensor for medical cooldown."""
 
     _attr_icon = "mdi:medical-bag"
@@ -737,19 +947,17 @@ class TornCooldownsMedicalSensor(TornSensor):
         """Return sensor name."""
         return "Cooldowns Medical"
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state as timestamp."""
-        if self.coordinator.data:
-            seconds = self.coordinator.data.get("cooldowns", {}).get("medical", 0)
+    def _target_timestamp(self) -> float | None:
+        """Return when the cooldown ends."""
+        if self.coordinator.data and (cooldowns := self.coordinator.data.get("cooldowns")):
+            seconds = cooldowns.medical
             if seconds > 0:
                 # Use cache time to calculate stable timestamp
-                fetch_time = self.coordinator.cache_times.get("cooldowns", datetime.now(timezone.utc).timestamp())
-                return datetime.fromtimestamp(fetch_time, tz=timezone.utc).replace(microsecond=0) + timedelta(seconds=seconds)
+                return int(self.coordinator.hub.cache_times.get("cooldowns", time())) + seconds
         return None
 
 
-class TornCooldownsBoosterSensor(TornSensor):
+class TornCooldownsBoosterSensor(TornCountdownSensor):
     """Sensor for booster cooldown."""
 
     _attr_icon = "mdi:rocket-launch"
@@ -765,15 +973,13 @@ class TornCooldownsBoosterSensor(TornSensor):
         """Return sensor name."""
         return "Cooldowns Booster"
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state as timestamp."""
-        if self.coordinator.data:
-            seconds = self.coordinator.data.get("cooldowns", {}).get("booster", 0)
+    def _target_timestamp(self) -> float | None:
+        """Return when the cooldown ends."""
+        if self.coordinator.data and (cooldowns := self.coordinator.data.get("cooldowns")):
+            seconds = cooldowns.booster
             if seconds > 0:
                 # Use cache time to calculate stable timestamp
-                fetch_time = self.coordinator.cache_times.get("cooldowns", datetime.now(timezone.utc).timestamp())
-                return datetime.fromtimestamp(fetch_time, tz=timezone.utc).replace(microsecond=0) + timedelta(seconds=seconds)
+                return int(self.coordinator.hub.cache_times.get("cooldowns", time())) + seconds
         return None
 
 
@@ -801,8 +1007,8 @@ class TornMoneyPointsSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("money", {}).get("points")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            return money.points
         return None
 
 
@@ -827,8 +1033,8 @@ class TornMoneyWalletSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("money", {}).get("wallet")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            return money.wallet
         return None
 
 
@@ -853,8 +1059,8 @@ class TornMoneyCompanySensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("money", {}).get("company")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            return money.company
         return None
 
 
@@ -879,8 +1085,8 @@ class TornMoneyVaultSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("money", {}).get("vault")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            return money.vault
         return None
 
 
@@ -905,8 +1111,8 @@ class TornMoneyCaymanBankSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("money", {}).get("cayman_bank")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            return money.cayman_bank
         return None
 
 
@@ -931,10 +1137,9 @@ class TornMoneyCityBankSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            city_bank = self.coordinator.data.get("money", {}).get("city_bank", {})
-            if isinstance(city_bank, dict):
-                return city_bank.get("amount")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            if money.city_bank:
+                return money.city_bank.amount
         return None
 
 
@@ -959,10 +1164,9 @@ class TornMoneyFactionSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            faction = self.coordinator.data.get("money", {}).get("faction", {})
-            if isinstance(faction, dict):
-                return faction.get("money")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            if money.faction:
+                return money.faction.money
         return None
 
 
@@ -987,11 +1191,81 @@ class TornMoneyDailyNetworthSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("money", {}).get("daily_networth")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            return money.daily_networth
         return None
 
 
+class TornMoneyLiveNetworthSensor(TornSensor):
+    """Sensor for networth estimated live between daily snapshots."""
+
+    _attr_icon = "mdi:chart-line-variant"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_native_unit_of_measurement = "$"
+    # Changes with every price tick; cash and portfolio go to long-term statistics
+    _unrecorded_attributes = frozenset({"cash", "portfolio", "other_assets", "change_since_daily"})
+    # Availability at the last state write, to catch the money tier failing or recovering
+    _written_available: bool | None = None
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{self.entry.entry_id}_money_live_networth"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "Money Live Networth"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the estimated networth."""
+        return self.coordinator.hub.networth.value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the parts of the estimate."""
+        networth = self.coordinator.hub.networth
+        value = networth.value
+        return {
+            "cash": networth.cash,
+            "portfolio": networth.portfolio,
+            "other_assets": networth.other_assets,
+            "daily_networth": networth.daily_networth,
+            "change_since_daily": (
+                value - networth.daily_networth
+                if value is not None and networth.daily_networth is not None
+                else None
+            ),
+            "reconciled_at": (
+                datetime.fromtimestamp(networth.reconciled_at, tz=timezone.utc).isoformat()
+                if networth.reconciled_at
+                else None
+            ),
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the estimate, which also changes with stock prices."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.hub.networth.async_add_listener(self._async_write_state))
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the state and remember the availability it was written with."""
+        self._written_available = self.available
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write money updates only when availability changed.
+
+        The estimate notifies whenever its value changed.
+        """
+        if self.available != self._written_available:
+            self._async_write_state()
+
+
 class TornMoneyCityBankProfitSensor(TornSensor):
     """Sensor for city bank profit."""
 
@@ -1013,10 +1287,9 @@ class TornMoneyCityBankProfitSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            city_bank = self.coordinator.data.get("money", {}).get("city_bank", {})
-            if isinstance(city_bank, dict):
-                return city_bank.get("profit")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            if money.city_bank:
+                return money.city_bank.profit
         return None
 
 
@@ -1040,10 +1313,9 @@ class TornMoneyCityBankDurationSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            city_bank = self.coordinator.data.get("money", {}).get("city_bank", {})
-            if isinstance(city_bank, dict):
-                return city_bank.get("duration")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            if money.city_bank:
+                return money.city_bank.duration
         return None
 
 
@@ -1067,14 +1339,13 @@ class TornMoneyCityBankInterestRateSensor(TornSensor):
     @property
     def native_value(self) -> float | None:
         """Return the state."""
-        if self.coordinator.data:
-            city_bank = self.coordinator.data.get("money", {}).get("city_bank", {})
-            if isinstance(city_bank, dict):
-                return city_bank.get("interest_rate")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            if money.city_bank:
+                return money.city_bank.interest_rate
         return None
 
 
-class TornMoneyCityBankUntilSensor(TornSensor):
+class TornMoneyCityBankUntilSensor(TornCountdownSensor):
     """Sensor for city bank investment end time."""
 
     _attr_icon = "mdi:clock-end"
@@ -1090,17 +1361,24 @@ class TornMoneyCityBankUntilSensor(TornSensor):
         """Return sensor name."""
         return "Money City Bank Until"
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state."""
-        if self.coordinator.data:
-            city_bank = self.coordinator.data.get("money", {}).get("city_bank", {})
-            if isinstance(city_bank, dict):
-                until_timestamp = city_bank.get("until")
-                if until_timestamp:
-                    return datetime.fromtimestamp(until_timestamp, tz=timezone.utc)
+    # The end date stays meaningful after the investment matures
+    _clear_on_expiry = False
+
+    def _target_timestamp(self) -> float | None:
+        """Return when the investment matures."""
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            if money.city_bank:
+                return money.city_bank.until or None
         return None
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether the investment has matured."""
+        target = self._target_timestamp()
+        if target is None:
+            return {}
+        return {"matured": target <= time()}
+
 
 class TornMoneyCityBankInvestedAtSensor(TornSensor):
     """Sensor for city bank investment start time."""
@@ -1121,10 +1399,9 @@ class TornMoneyCityBankInvestedAtSensor(TornSensor):
     @property
     def native_value(self) -> datetime | None:
         """Return the state."""
-        if self.coordinator.data:
-            city_bank = self.coordinator.data.get("money", {}).get("city_bank", {})
-            if isinstance(city_bank, dict):
-                invested_at = city_bank.get("invested_at")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            if money.city_bank:
+                invested_at = money.city_bank.invested_at
                 if invested_at:
                     return datetime.fromtimestamp(invested_at, tz=timezone.utc)
         return None
@@ -1149,10 +1426,9 @@ class TornMoneyFactionPointsSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            faction = self.coordinator.data.get("money", {}).get("faction", {})
-            if isinstance(faction, dict):
-                return faction.get("points")
+        if self.coordinator.data and (money := self.coordinator.data.get("money")):
+            if money.faction:
+                return money.faction.points
         return None
 
 
@@ -1179,8 +1455,8 @@ class TornTravelDestinationSensor(TornSensor):
     @property
     def native_value(self) -> str | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("travel", {}).get("destination")
+        if self.coordinator.data and (travel := self.coordinator.data.get("travel")):
+            return travel.destination
         return None
 
 
@@ -1202,9 +1478,8 @@ class TornTravelMethodSensor(TornSensor):
     @property
     def native_value(self) -> str | None:
         """Return the state."""
-        if self.coordinator.data:
-            method = self.coordinator.data.get("travel", {}).get("method")
-            return str(method) if method else None
+        if self.coordinator.data and (travel := self.coordinator.data.get("travel")):
+            return travel.method or None
         return None
 
 
@@ -1227,8 +1502,8 @@ class TornTravelDepartedAtSensor(TornSensor):
     @property
     def native_value(self) -> datetime | None:
         """Return the state."""
-        if self.coordinator.data:
-            timestamp = self.coordinator.data.get("travel", {}).get("departed_at")
+        if self.coordinator.data and (travel := self.coordinator.data.get("travel")):
+            timestamp = travel.departed_at
             if timestamp:
                 return datetime.fromtimestamp(timestamp, tz=timezone.utc)
         return None
@@ -1253,14 +1528,14 @@ class TornTravelArrivalAtSensor(TornSensor):
     @property
     def native_value(self) -> datetime | None:
         """Return the state."""
-        if self.coordinator.data:
-            timestamp = self.coordinator.data.get("travel", {}).get("arrival_at")
+        if self.coordinator.data and (travel := self.coordinator.data.get("travel")):
+            timestamp = travel.arrival_at
             if timestamp:
                 return datetime.fromtimestamp(timestamp, tz=timezone.utc)
         return None
 
 
-class TornTravelTimeLeftSensor(TornSensor):
+class TornTravelTimeLeftSensor(TornCountdownSensor):
     """Sensor for travel time left."""
 
     _attr_icon = "mdi:timer-sand"
@@ -1277,12 +1552,23 @@ class TornTravelTimeLeftSensor(TornSensor):
         """Return sensor name."""
         return "Travel Time Left"
 
+    _tick = True
+
+    def _target_timestamp(self) -> float | None:
+        """Return when the flight lands."""
+        if self.coordinator.data and (travel := self.coordinator.data.get("travel")):
+            if travel.arrival_at:
+                return travel.arrival_at
+            return int(self.coordinator.hub.cache_times.get("travel", time())) + travel.time_left
+        return None
+
     @property
     def native_value(self) -> int | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("travel", {}).get("time_left")
-        return None
+        """Return the seconds left until landing."""
+        target = self._target_timestamp()
+        if target is None:
+            return None
+        return max(0, round(target - time()))
 
 
 # ============================================================================
@@ -1379,6 +1665,139 @@ class TornLogLatestSensor(TornSensor):
         return {}
 
 
+class TornEventsLatestSensor(TornSensor):
+    """Sensor for the latest entry in the events feed."""
+
+    _attr_icon = "mdi:bell-ring"
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{self.entry.entry_id}_events_latest"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "Events Latest"
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the state (latest event as plain text)."""
+        if self.coordinator.data and (events := self.coordinator.data.get("events")):
+            return _strip_html(events[0].get("event") or "")[:255]
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the most recent events."""
+        if self.coordinator.data and (events := self.coordinator.data.get("events")):
+            entries = [
+                {
+                    "id": event.get("id"),
+                    "timestamp": event.get("timestamp"),
+                    "event": _strip_html(event.get("event") or ""),
+                }
+                for event in events[:10]  # Latest 10
+            ]
+            return {"entries": entries, "count": len(entries)}
+        return {}
+
+
+def _strip_html(text: str) -> str:
+    """Return event text without the HTML links Torn embeds in it."""
+    return re.sub(r"<[^>]+>", "", text).strip()
+
+
+# ============================================================================
+# Item Catalog Sensor
+# ============================================================================
+
+
+class TornItemCatalogSensor(TornSensor):
+    """Sensor for the item reference catalog."""
+
+    _attr_icon = "mdi:book-open-variant"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{self.entry.entry_id}_item_catalog"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "Item Catalog"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of items in the catalog."""
+        catalog = self.coordinator.hub.catalog
+        if catalog and catalog.loaded:
+            return len(catalog.by_id)
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return catalog version and refresh time."""
+        catalog = self.coordinator.hub.catalog
+        if catalog and catalog.loaded:
+            return {
+                "version": catalog.version,
+                "fetched_at": datetime.fromtimestamp(catalog.fetched_at, tz=timezone.utc).isoformat(),
+            }
+        return {}
+
+
+class TornApiRateSensor(TornSensor):
+    """Sensor for the adaptive API request rate."""
+
+    _attr_icon = "mdi:speedometer-slow"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "requests/min"
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{self.entry.entry_id}_api_rate"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "API Request Rate"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the currently allowed requests per minute."""
+        if throttle := self.coordinator.hub.throttle:
+            return int(throttle.rate)
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return throttle details."""
+        throttle = self.coordinator.hub.throttle
+        if throttle is None:
+            return {}
+        return {
+            "max_rate": throttle.max_rate,
+            "interval_multiplier": round(throttle.interval_multiplier, 2),
+            "rate_limit_errors": throttle.rate_limit_errors,
+            "last_decrease": (
+                datetime.fromtimestamp(throttle.last_decrease, tz=timezone.utc).isoformat()
+                if throttle.last_decrease
+                else None
+            ),
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Follow rate changes as well as coordinator updates."""
+        await super().async_added_to_hass()
+        if throttle := self.coordinator.hub.throttle:
+            self.async_on_remove(throttle.async_add_listener(self.async_write_ha_state))
+
+
 class TornCompanyFundsSensor(TornSensor):
     """Sensor for company funds."""
 
@@ -1400,8 +1819,8 @@ class TornCompanyFundsSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company_detailed", {}).get("company_funds")
+        if self.coordinator.data and (company := self.coordinator.data.get("company_detailed")):
+            return company.company_funds
         return None
 
 
@@ -1425,8 +1844,8 @@ class TornCompanyPopularitySensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company_detailed", {}).get("popularity")
+        if self.coordinator.data and (company := self.coordinator.data.get("company_detailed")):
+            return company.popularity
         return None
 
 
@@ -1450,8 +1869,8 @@ class TornCompanyEfficiencySensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company_detailed", {}).get("efficiency")
+        if self.coordinator.data and (company := self.coordinator.data.get("company_detailed")):
+            return company.efficiency
         return None
 
 
@@ -1475,8 +1894,8 @@ class TornCompanyEnvironmentSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company_detailed", {}).get("environment")
+        if self.coordinator.data and (company := self.coordinator.data.get("company_detailed")):
+            return company.environment
         return None
 
 
@@ -1499,8 +1918,8 @@ class TornCompanyTrainsAvailableSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company_detailed", {}).get("trains_available")
+        if self.coordinator.data and (company := self.coordinator.data.get("company_detailed")):
+            return company.trains_available
         return None
 
 
@@ -1525,8 +1944,8 @@ class TornCompanyAdvertisingBudgetSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company_detailed", {}).get("advertising_budget")
+        if self.coordinator.data and (company := self.coordinator.data.get("company_detailed")):
+            return company.advertising_budget
         return None
 
 
@@ -1549,8 +1968,8 @@ class TornCompanyRatingSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company", {}).get("rating")
+        if self.coordinator.data and (company := self.coordinator.data.get("company")):
+            return company.rating
         return None
 
 
@@ -1572,8 +1991,8 @@ class TornCompanyNameSensor(TornSensor):
     @property
     def native_value(self) -> str | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company", {}).get("name")
+        if self.coordinator.data and (company := self.coordinator.data.get("company")):
+            return company.name
         return None
 
 
@@ -1598,8 +2017,8 @@ class TornCompanyDailyIncomeSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company", {}).get("daily_income")
+        if self.coordinator.data and (company := self.coordinator.data.get("company")):
+            return company.daily_income
         return None
 
 
@@ -1624,8 +2043,8 @@ class TornCompanyWeeklyIncomeSensor(TornSensor):
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("company", {}).get("weekly_income")
+        if self.coordinator.data and (company := self.coordinator.data.get("company")):
+            return company.weekly_income
         return None
 
 
@@ -1641,13 +2060,18 @@ class TornStockSensor(TornSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_native_unit_of_measurement = "$"
+    # Derived from the price on every tick, so recording them only grows the database
+    _unrecorded_attributes = frozenset({
+        "total_value", "sma", "ema", "volatility", "drawdown", "momentum", "momentum_rank",
+        "benefit_value", "next_block_shares", "next_block_cost", "roi", "roi_rank",
+    })
 
     def __init__(
         self,
         coordinator: TornDataUpdateCoordinator,
         entry: ConfigEntry,
         stock_id: str,
-        stock_data: dict,
+        stock_data: Stock,
     ) -> None:
         """Initialize the stock sensor."""
         super().__init__(coordinator, entry)
@@ -1662,16 +2086,16 @@ class TornStockSensor(TornSensor):
     @property
     def name(self) -> str:
         """Return sensor name."""
-        acronym = self._stock_data.get("acronym", f"Stock {self.stock_id}")
+        acronym = self._stock_data.acronym or f"Stock {self.stock_id}"
         return f"Stock {acronym}"
 
     @property
     def native_value(self) -> float | None:
         """Return the state (current stock price)."""
         if self.coordinator.data:
-            torn_stocks = self.coordinator.data.get("torn_stocks", {})
-            stock_info = torn_stocks.get(self.stock_id, {})
-            return stock_info.get("current_price")
+            torn_stocks = self.coordinator.data.get("torn_stocks") or {}
+            if stock_info := torn_stocks.get(self.stock_id):
+                return stock_info.current_price
         return None
 
     @property
@@ -1681,54 +2105,52 @@ class TornStockSensor(TornSensor):
             return {}
 
         # Get torn stocks data (market info)
-        torn_stocks = self.coordinator.data.get("torn_stocks", {})
-        stock_info = torn_stocks.get(self.stock_id, {})
+        torn_stocks = self.coordinator.data.get("torn_stocks") or {}
+        stock_info = torn_stocks.get(self.stock_id)
+        if stock_info is None:
+            return {}
 
         # Get user stocks data (ownership info)
-        user_stocks = self.coordinator.data.get("user_stocks", {})
-        user_stock = user_stocks.get(self.stock_id, {})
+        user_stocks = self.coordinator.data.get("user_stocks") or {}
+        user_stock = user_stocks.get(self.stock_id)
 
         # Basic stock information
-        current_price = stock_info.get("current_price", 0)
-        total_shares_owned = user_stock.get("total_shares", 0)
+        current_price = stock_info.current_price
+        total_shares_owned = user_stock.total_shares if user_stock else 0
 
         attributes = {
             "stock_id": int(self.stock_id),
             "shares_owned": total_shares_owned,
             "total_value": current_price * total_shares_owned if total_shares_owned else 0,
-            "name": stock_info.get("name"),
-            "acronym": stock_info.get("acronym"),
-            "market_cap": stock_info.get("market_cap"),
-            "total_shares": stock_info.get("total_shares"),
-            "investors": stock_info.get("investors"),
+            "name": stock_info.name,
+            "acronym": stock_info.acronym,
+            "market_cap": stock_info.market_cap,
+            "total_shares": stock_info.total_shares,
+            "investors": stock_info.investors,
         }
 
         # Benefit information from torn stocks
-        benefit = stock_info.get("benefit", {})
-        if benefit:
-            attributes["benefit_type"] = benefit.get("type")
-            attributes["benefit_requirement"] = benefit.get("requirement")
-            attributes["benefit_description"] = benefit.get("description")
-            attributes["benefit_frequency"] = benefit.get("frequency")
+        if benefit := stock_info.benefit:
+            attributes["benefit_type"] = benefit.type
+            attributes["benefit_requirement"] = benefit.requirement
+            attributes["benefit_description"] = benefit.description
+            attributes["benefit_frequency"] = benefit.frequency
 
         # User-specific benefit/dividend info (only if owned)
         if user_stock:
             # Handle both "benefit" and "dividend" keys
-            user_benefit = user_stock.get("benefit") or user_stock.get("dividend", {})
-            if user_benefit:
-                attributes["blocks_active"] = user_benefit.get("increment", 0)
-                attributes["blocks_next_payout_progress"] = user_benefit.get("progress", 0)
-                attributes["blocks_ready_to_claim"] = bool(user_benefit.get("ready", 0))
+            if user_benefit := user_stock.benefit or user_stock.dividend:
+                attributes["blocks_active"] = user_benefit.increment
+                attributes["blocks_next_payout_progress"] = user_benefit.progress
+                attributes["blocks_ready_to_claim"] = bool(user_benefit.ready)
 
                 # Calculate total benefit per payout (increment × benefit amount)
                 # Note: benefit_description might need parsing if it's a string like "$50,000,000"
-                increment = user_benefit.get("increment", 0)
-                if increment > 0:
-                    attributes["blocks_next_payout_frequency"] = user_benefit.get("frequency")
+                if user_benefit.increment > 0:
+                    attributes["blocks_next_payout_frequency"] = user_benefit.frequency
 
             # Add individual block (transaction) details
-            transactions = user_stock.get("transactions", {})
-            if transactions:
+            if transactions := user_stock.transactions:
                 attributes["number_of_blocks"] = len(transactions)
 
                 # Calculate totals for average price
@@ -1737,22 +2159,20 @@ class TornStockSensor(TornSensor):
 
                 # Sort transactions by time_bought (oldest first)
                 sorted_transactions = sorted(
-                    transactions.items(),
-                    key=lambda x: x[1].get("time_bought", 0)
+                    transactions.values(),
+                    key=lambda transaction: transaction.time_bought or 0
                 )
 
-                block_num = 1
-                for transaction_id, transaction_data in sorted_transactions:
-                    block_shares = transaction_data.get("shares", 0)
-                    block_bought_price = transaction_data.get("bought_price", 0)
+                for block_num, transaction in enumerate(sorted_transactions, start=1):
+                    block_shares = transaction.shares
+                    block_bought_price = transaction.bought_price
 
                     attributes[f"block_{block_num}_shares"] = block_shares
                     attributes[f"block_{block_num}_bought_price"] = block_bought_price
 
                     # Add time_bought as datetime if available
-                    time_bought = transaction_data.get("time_bought")
-                    if time_bought:
-                        attributes[f"block_{block_num}_time_bought"] = datetime.fromtimestamp(time_bought, tz=timezone.utc).isoformat()
+                    if transaction.time_bought:
+                        attributes[f"block_{block_num}_time_bought"] = datetime.fromtimestamp(transaction.time_bought, tz=timezone.utc).isoformat()
 
                     # Calculate value for this block
                     block_invested = block_shares * block_bought_price
@@ -1765,11 +2185,156 @@ class TornStockSensor(TornSensor):
                     total_invested += block_invested
                     total_current_value += block_current_value
 
-                    block_num += 1
-
                 # Add summary attributes
                 attributes["total_invested"] = total_invested
                 attributes["average_bought_price"] = total_invested / total_shares_owned if total_shares_owned > 0 else 0
                 attributes["total_profit_loss"] = total_current_value - total_invested
 
+        # Rolling market analytics (computed once per market update for all stocks)
+        analytics = self.coordinator.hub.stock_analytics.get(self.stock_id)
+        if analytics:
+            attributes["sma"] = analytics.get("sma")
+            attributes["ema"] = analytics.get("ema")
+            attributes["volatility"] = analytics.get("volatility")
+            attributes["drawdown"] = analytics.get("drawdown")
+            attributes["momentum"] = analytics.get("momentum")
+            attributes["momentum_rank"] = analytics.get("momentum_rank")
+
+        # Return of buying the next benefit block (only for priceable active benefits)
+        if roi := self.coordinator.hub.stock_roi.get(self.stock_id):
+            attributes["benefit_value"] = roi["benefit_value"]
+            attributes["next_block_shares"] = roi["next_block_shares"]
+            attributes["next_block_cost"] = roi["next_block_cost"]
+            attributes["roi"] = roi["roi"]
+            attributes["roi_rank"] = roi["roi_rank"]
+
         return attributes
+
+
+class TornStockBestRoiSensor(TornSensor):
+    """Sensor for the stock whose next benefit block returns the most."""
+
+    _attr_icon = "mdi:trophy"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "%"
+    _unrecorded_attributes = frozenset({"ranking"})
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{self.entry.entry_id}_stock_best_roi"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "Stock Best ROI"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the annual return of the best next block in percent."""
+        stock_roi = self.coordinator.hub.stock_roi
+        if stock_roi.ranking:
+            return stock_roi.results[stock_roi.ranking[0]]["roi"]
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return all priced stocks, best first."""
+        stock_roi = self.coordinator.hub.stock_roi
+        if not stock_roi.ranking:
+            return {}
+        return {
+            "acronym": stock_roi.results[stock_roi.ranking[0]]["acronym"],
+            "ranking": [stock_roi.results[stock_id] for stock_id in stock_roi.ranking],
+        }
+
+
+# ============================================================================
+# Household Sensors (across all loaded entries)
+# ============================================================================
+
+
+class TornHouseholdSensor(SensorEntity):
+    """Base class for household totals across all Torn accounts."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_native_unit_of_measurement = "$"
+    # Figure in TornHousehold.totals
+    _figure: str
+
+    def __init__(self, household: TornHousehold) -> None:
+        """Initialize the sensor."""
+        self.household = household
+        self._attr_has_entity_name = True
+
+        # One household device, shown on the entry that enables it
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "household")},
+            name="Torn Household",
+            manufacturer="Torn City",
+            model="Household",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{DOMAIN}_household_{self._figure}"
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.household.members > 0
+
+    @property
+    def native_value(self) -> int:
+        """Return the total over all accounts."""
+        return self.household.totals[self._figure]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of accounts included."""
+        return {"accounts": self.household.members}
+
+    async def async_added_to_hass(self) -> None:
+        """Follow changes of the totals."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.household.async_add_listener(self.async_write_ha_state))
+
+
+class TornHouseholdCashSensor(TornHouseholdSensor):
+    """Sensor for cash across all accounts."""
+
+    _attr_icon = "mdi:cash-multiple"
+    _figure = "cash"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "Cash"
+
+
+class TornHouseholdNetworthSensor(TornHouseholdSensor):
+    """Sensor for networth across all accounts."""
+
+    _attr_icon = "mdi:chart-line"
+    _figure = "networth"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "Networth"
+
+
+class TornHouseholdPortfolioSensor(TornHouseholdSensor):
+    """Sensor for stock holdings across all accounts."""
+
+    _attr_icon = "mdi:briefcase"
+    _figure = "portfolio"
+
+    @property
+    def name(self) -> str:
+        """Return sensor name."""
+        return "Portfolio"
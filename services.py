@@ -0,0 +1,287 @@
+"""Services for Torn City integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import tracemalloc
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CATEGORY,
+    ATTR_CYCLES,
+    ATTR_DATA_KEYS,
+    ATTR_END,
+    ATTR_ENTRY_ID,
+    ATTR_LIMIT,
+    ATTR_LOG_TYPE,
+    ATTR_OFFSET,
+    ATTR_PROFILE,
+    ATTR_START,
+    ATTR_TITLE,
+    ATTR_TOP,
+    CYCLE_WAIT_TIMEOUT,
+    DOMAIN,
+    LOG_SEARCH_DEFAULT_LIMIT,
+    LOG_SEARCH_MAX_LIMIT,
+    MEMORY_DEFAULT_CYCLES,
+    MEMORY_MAX_CYCLES,
+    POLLING_PROFILES,
+    PROFILE_DEFAULT_CYCLES,
+    PROFILE_DEFAULT_TOP,
+    PROFILE_FILENAME,
+    PROFILE_MAX_CYCLES,
+    SERVICE_MEMORY_REPORT,
+    SERVICE_PROFILE,
+    SERVICE_REFRESH,
+    SERVICE_SEARCH_LOG,
+    SERVICE_SET_POLLING_PROFILE,
+)
+from .coordinator import TornDataHub
+from .memory import compare_snapshots, hub_memory_report, take_snapshot
+from .profiler import TornCycleProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DATA_KEYS): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SET_POLLING_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PROFILE): vol.In(list(POLLING_PROFILES)),
+    }
+)
+
+SEARCH_LOG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CATEGORY): cv.string,
+        vol.Optional(ATTR_LOG_TYPE): vol.Coerce(int),
+        vol.Optional(ATTR_TITLE): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_LIMIT, default=LOG_SEARCH_DEFAULT_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=LOG_SEARCH_MAX_LIMIT)
+        ),
+        vol.Optional(ATTR_OFFSET, default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=PROFILE_DEFAULT_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_CYCLES)
+        ),
+        vol.Optional(ATTR_TOP, default=PROFILE_DEFAULT_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+
+MEMORY_REPORT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=MEMORY_DEFAULT_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MEMORY_MAX_CYCLES)
+        ),
+        vol.Optional(ATTR_TOP, default=PROFILE_DEFAULT_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+
+
+def _get_hubs(hass: HomeAssistant, entry_id: str | None) -> list[TornDataHub]:
+    """Return the data hubs targeted by a service call."""
+    entries = {
+        key: value
+        for key, value in hass.data.get(DOMAIN, {}).items()
+        if isinstance(value, dict) and "hub" in value
+    }
+    if entry_id is not None:
+        if entry_id not in entries:
+            raise ServiceValidationError(f"Torn config entry {entry_id} is not loaded")
+        return [entries[entry_id]["hub"]]
+    return [entry_data["hub"] for entry_data in entries.values()]
+
+
+async def _async_wait_cycles(hubs: list[TornDataHub], cycles: int) -> int:
+    """Wait until the hubs completed the given number of tier updates.
+
+    Returns the number of updates seen, which is lower than requested when
+    the wait timed out.
+    """
+    finished = 0
+    done = asyncio.Event()
+
+    @callback
+    def cycle_finished() -> None:
+        nonlocal finished
+        finished += 1
+        if finished >= cycles:
+            done.set()
+
+    removers = [hub.async_add_cycle_listener(cycle_finished) for hub in hubs]
+    try:
+        await asyncio.wait_for(done.wait(), CYCLE_WAIT_TIMEOUT)
+    except asyncio.TimeoutError:
+        _LOGGER.warning(f"Only {finished} of {cycles} cycles finished within {CYCLE_WAIT_TIMEOUT}s")
+    finally:
+        for remove in removers:
+            remove()
+    return finished
+
+
+async def _async_handle_refresh(call: ServiceCall) -> None:
+    """Force a refresh of selected data keys, bypassing the cache."""
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    hubs = _get_hubs(call.hass, entry_id)
+
+    refreshes = []
+    for hub in hubs:
+        requested = set(call.data.get(ATTR_DATA_KEYS) or hub.enabled_data_keys)
+        unknown = requested - hub.enabled_data_keys
+        # Only a targeted call is strict; otherwise each entry refreshes what it has enabled
+        if unknown and entry_id is not None:
+            raise ServiceValidationError(
+                f"Unknown or disabled data keys: {', '.join(sorted(unknown))}"
+            )
+        refreshes.append(hub.async_refresh_keys(requested - unknown))
+
+    results = await asyncio.gather(*refreshes)
+    _LOGGER.debug(f"Forced refresh fetched {[sorted(fetched) for fetched in results]}")
+
+
+async def _async_handle_set_polling_profile(call: ServiceCall) -> None:
+    """Switch the polling profile without reloading the entry."""
+    for hub in _get_hubs(call.hass, call.data.get(ATTR_ENTRY_ID)):
+        hub.async_set_polling_profile(call.data[ATTR_PROFILE])
+
+
+async def _async_handle_search_log(call: ServiceCall) -> ServiceResponse:
+    """Search the local log archive."""
+    archive = call.hass.data.get(DOMAIN, {}).get("log_archive")
+    if archive is None:
+        raise ServiceValidationError("The log archive is not enabled (enable the Activity Log option)")
+
+    hubs = _get_hubs(call.hass, call.data.get(ATTR_ENTRY_ID))
+    start = call.data.get(ATTR_START)
+    end = call.data.get(ATTR_END)
+
+    return await archive.async_search(
+        [hub.entry_id for hub in hubs],
+        category=call.data.get(ATTR_CATEGORY),
+        log_type=call.data.get(ATTR_LOG_TYPE),
+        title=call.data.get(ATTR_TITLE),
+        start=int(dt_util.as_utc(start).timestamp()) if start else None,
+        end=int(dt_util.as_utc(end).timestamp()) if end else None,
+        limit=call.data[ATTR_LIMIT],
+        offset=call.data[ATTR_OFFSET],
+    )
+
+
+async def _async_handle_profile(call: ServiceCall) -> ServiceResponse:
+    """Record a CPU profile of the next coordinator cycles."""
+    hass = call.hass
+    hubs = _get_hubs(hass, call.data.get(ATTR_ENTRY_ID))
+    if not hubs:
+        raise ServiceValidationError("No Torn config entry is loaded")
+    if any(hub.profiler is not None for hub in hubs):
+        raise ServiceValidationError("A profile is already being recorded")
+
+    profiler = TornCycleProfiler()
+    try:
+        profiler.check_available()
+    except ValueError as err:
+        raise ServiceValidationError(f"Another profiler is already running: {err}") from err
+    for hub in hubs:
+        hub.profiler = profiler
+    try:
+        cycles = await _async_wait_cycles(hubs, call.data[ATTR_CYCLES])
+    finally:
+        for hub in hubs:
+            hub.profiler = None
+
+    path = hass.config.path(PROFILE_FILENAME.format(timestamp=dt_util.now().strftime("%Y%m%d_%H%M%S")))
+    await hass.async_add_executor_job(profiler.save, path)
+    _LOGGER.info(f"Saved profile of {cycles} coordinator cycles to {path}")
+
+    return {
+        "path": path,
+        "cycles": cycles,
+        "functions": profiler.summary(call.data[ATTR_TOP]),
+    }
+
+
+async def _async_handle_memory_report(call: ServiceCall) -> ServiceResponse:
+    """Report retained memory and the heap growth over the next cycles."""
+    hass = call.hass
+    hubs = _get_hubs(hass, call.data.get(ATTR_ENTRY_ID))
+    cycles = call.data[ATTR_CYCLES]
+
+    response: dict[str, Any] = {}
+    if cycles and hubs:
+        # Tracing slows every allocation down, so it only runs for this call
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            before = await hass.async_add_executor_job(take_snapshot)
+            response["cycles"] = await _async_wait_cycles(hubs, cycles)
+            after = await hass.async_add_executor_job(take_snapshot)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+        response["heap_growth"] = compare_snapshots(before, after, call.data[ATTR_TOP])
+
+    response["entries"] = {hub.entry_id: hub_memory_report(hass, hub) for hub in hubs}
+    return response
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services (once for all entries)."""
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH):
+        return
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH, _async_handle_refresh, schema=REFRESH_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_POLLING_PROFILE,
+        _async_handle_set_polling_profile,
+        schema=SET_POLLING_PROFILE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_LOG,
+        _async_handle_search_log,
+        schema=SEARCH_LOG_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MEMORY_REPORT,
+        _async_handle_memory_report,
+        schema=MEMORY_REPORT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,110 @@
+"""Rolling stock market analytics for Torn City integration."""
+from __future__ import annotations
+
+from collections import deque
+import logging
+import math
+from typing import Any
+
+from .const import STOCK_ANALYTICS_EMA_SPAN, STOCK_ANALYTICS_WINDOW
+from .models import Stock
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StockMarketAnalytics:
+    """Keep rolling price windows for every stock and derive indicators.
+
+    All stocks are processed together in a single pass per market update.
+    Running sums are maintained incrementally so each update costs
+    O(number of stocks) for SMA, EMA and volatility; only drawdown needs the
+    window maximum.
+    """
+
+    def __init__(
+        self,
+        window: int = STOCK_ANALYTICS_WINDOW,
+        ema_span: int = STOCK_ANALYTICS_EMA_SPAN,
+    ) -> None:
+        """Initialize the analytics state."""
+        self.window = window
+        self.ema_alpha = 2 / (ema_span + 1)
+        self._prices: dict[str, deque[float]] = {}
+        self._returns: dict[str, deque[float]] = {}
+        self._price_sum: dict[str, float] = {}
+        self._return_sum: dict[str, float] = {}
+        self._return_sq_sum: dict[str, float] = {}
+        self._ema: dict[str, float] = {}
+        self.results: dict[str, dict[str, Any]] = {}
+        self.last_update: float | None = None
+
+    def update(self, torn_stocks: dict[str, Stock], timestamp: float) -> None:
+        """Ingest one market snapshot and recompute indicators for all stocks."""
+        if not isinstance(torn_stocks, dict):
+            return
+
+        momentum: dict[str, float] = {}
+        results: dict[str, dict[str, Any]] = {}
+
+        for stock_id, stock_info in torn_stocks.items():
+            price = stock_info.current_price
+            if price <= 0:
+                continue
+
+            prices = self._prices.setdefault(stock_id, deque())
+            returns = self._returns.setdefault(stock_id, deque())
+
+            # Log return against the previous sample
+            if prices:
+                log_return = math.log(price / prices[-1])
+                returns.append(log_return)
+                self._return_sum[stock_id] = self._return_sum.get(stock_id, 0.0) + log_return
+                self._return_sq_sum[stock_id] = self._return_sq_sum.get(stock_id, 0.0) + log_return * log_return
+                if len(returns) > self.window - 1:
+                    dropped = returns.popleft()
+                    self._return_sum[stock_id] -= dropped
+                    self._return_sq_sum[stock_id] -= dropped * dropped
+
+            prices.append(price)
+            self._price_sum[stock_id] = self._price_sum.get(stock_id, 0.0) + price
+            if len(prices) > self.window:
+                self._price_sum[stock_id] -= prices.popleft()
+
+            previous_ema = self._ema.get(stock_id)
+            ema = price if previous_ema is None else previous_ema + self.ema_alpha * (price - previous_ema)
+            self._ema[stock_id] = ema
+
+            samples = len(prices)
+            sma = self._price_sum[stock_id] / samples
+
+            volatility = None
+            if len(returns) > 1:
+                n = len(returns)
+                mean = self._return_sum[stock_id] / n
+                variance = max(self._return_sq_sum[stock_id] / n - mean * mean, 0.0)
+                volatility = math.sqrt(variance * n / (n - 1))
+
+            peak = max(prices)
+            momentum[stock_id] = price / prices[0] - 1
+
+            results[stock_id] = {
+                "sma": round(sma, 2),
+                "ema": round(ema, 2),
+                "volatility": round(volatility * 100, 4) if volatility is not None else None,
+                "drawdown": round((price / peak - 1) * 100, 4),
+                "momentum": round(momentum[stock_id] * 100, 4),
+                "samples": samples,
+            }
+
+        # Rank all stocks by momentum (1 = strongest)
+        ranked = sorted(momentum, key=momentum.__getitem__, reverse=True)
+        for rank, stock_id in enumerate(ranked, start=1):
+            results[stock_id]["momentum_rank"] = rank
+
+        self.results = results
+        self.last_update = timestamp
+        _LOGGER.debug(f"Updated stock analytics for {len(results)} stocks")
+
+    def get(self, stock_id: str) -> dict[str, Any]:
+        """Return the indicators for a stock."""
+        return self.results.get(stock_id, {})
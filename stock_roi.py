@@ -0,0 +1,115 @@
+"""Stock benefit block ROI for Torn City integration."""
+from __future__ import annotations
+
+from functools import lru_cache
+import logging
+import re
+from typing import Any
+
+from .catalog import TornItemCatalog
+from .models import Stock, UserStock
+
+_LOGGER = logging.getLogger(__name__)
+
+_CASH = re.compile(r"^\$\s*([\d,]+)$")
+# "1x Xanax", "3 Feathery Hotel Coupons", "a Box of Medical Supplies"
+_ITEM = re.compile(r"^(?:(\d+)\s*x?\s+|an?\s+)?(.+?)$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def parse_benefit(description: str) -> tuple[str, int, str | None] | None:
+    """Return (kind, quantity or amount, item name) for a benefit description."""
+    description = description.strip()
+    if match := _CASH.match(description):
+        return ("cash", int(match.group(1).replace(",", "")), None)
+    if match := _ITEM.match(description):
+        return ("item", int(match.group(1) or 1), match.group(2))
+    return None
+
+
+def benefit_value(description: str | None, catalog: TornItemCatalog | None) -> int | None:
+    """Return the cash value of one benefit payout, or None when it cannot be priced."""
+    if not description or (parsed := parse_benefit(description)) is None:
+        return None
+    kind, quantity, item_name = parsed
+    if kind == "cash":
+        return quantity
+    if catalog is None or not catalog.loaded or item_name is None:
+        return None
+    # Plural descriptions ("3 Feathery Hotel Coupons") name the item in the plural
+    market_value = catalog.market_value(item_name)
+    if market_value is None and quantity > 1 and item_name.endswith("s"):
+        market_value = catalog.market_value(item_name[:-1])
+    return quantity * market_value if market_value else None
+
+
+class StockRoiEngine:
+    """Price the next benefit block of every stock and rank them by return.
+
+    A block pays its benefit every `frequency` days for `requirement` shares.
+    Each further block of the same stock needs twice the shares of the one
+    before, so the next block costs current price x requirement x 2^owned.
+    All stocks are priced and ranked in one pass per market update.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty results."""
+        self.results: dict[str, dict[str, Any]] = {}
+        self.ranking: list[str] = []
+
+    def update(
+        self,
+        torn_stocks: dict[str, Stock] | None,
+        user_stocks: dict[str, UserStock] | None,
+        catalog: TornItemCatalog | None,
+    ) -> None:
+        """Recompute the ROI of every stock with a priceable active benefit."""
+        if not isinstance(torn_stocks, dict):
+            return
+        user_stocks = user_stocks or {}
+
+        results: dict[str, dict[str, Any]] = {}
+        for stock_id, stock in torn_stocks.items():
+            benefit = stock.benefit
+            if (
+                benefit is None
+                or benefit.type != "active"
+                or not benefit.frequency
+                or not benefit.requirement
+                or stock.current_price <= 0
+            ):
+                continue
+            if (value := benefit_value(benefit.description, catalog)) is None:
+                continue
+
+            owned_blocks = 0
+            if user_stock := user_stocks.get(stock_id):
+                if dividend := user_stock.benefit or user_stock.dividend:
+                    owned_blocks = dividend.increment
+
+            shares = benefit.requirement * 2**owned_blocks
+            cost = shares * stock.current_price
+            annual_value = value * 365 / benefit.frequency
+            results[stock_id] = {
+                "stock_id": int(stock_id),
+                "acronym": stock.acronym,
+                "benefit_value": value,
+                "payout_every_days": benefit.frequency,
+                "owned_blocks": owned_blocks,
+                "next_block_shares": shares,
+                "next_block_cost": round(cost),
+                "annual_value": round(annual_value),
+                "roi": round(annual_value / cost * 100, 2),
+            }
+
+        ranking = sorted(results, key=lambda stock_id: results[stock_id]["roi"], reverse=True)
+        for rank, stock_id in enumerate(ranking, start=1):
+            results[stock_id]["roi_rank"] = rank
+
+        self.results = results
+        self.ranking = ranking
+        _LOGGER.debug(f"Priced benefit blocks of {len(results)} stocks")
+
+    def get(self, stock_id: str) -> dict[str, Any]:
+        """Return the ROI figures for a stock."""
+        return self.results.get(stock_id, {})
@@ -0,0 +1,109 @@
+"""Adaptive request throttling for Torn City integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import logging
+from time import time
+
+from homeassistant.core import callback
+
+from .api import TornError, TornRateLimitError
+from .const import (
+    API_RATE_LIMIT,
+    THROTTLE_DECREASE_COOLDOWN,
+    THROTTLE_DECREASE_FACTOR,
+    THROTTLE_INCREASE_AFTER,
+    THROTTLE_INCREASE_STEP,
+    THROTTLE_MIN_RATE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TornAdaptiveThrottle:
+    """AIMD controller for the request rate of one API key.
+
+    The allowed rate is halved when Torn reports a rate-limit error and
+    raised by a fixed step after a run of successful requests. Every client
+    using the key waits for room in the shared per-minute window, and the
+    tier coordinators stretch their intervals by the same ratio.
+    """
+
+    def __init__(self, max_rate: int = API_RATE_LIMIT) -> None:
+        """Initialize the throttle at full rate."""
+        self.max_rate = max_rate
+        self.rate = float(max_rate)
+        self.rate_limit_errors = 0
+        self.last_decrease: float | None = None
+        self._successes = 0
+        # Timestamps of requests sent in the last minute by every client on the key
+        self._request_times: deque[float] = deque()
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def interval_multiplier(self) -> float:
+        """Return how much slower than normal the coordinators should poll."""
+        return self.max_rate / self.rate
+
+    def _trim(self, now: float) -> None:
+        """Drop request timestamps older than the one-minute window."""
+        cutoff = now - 60
+        while self._request_times and self._request_times[0] < cutoff:
+            self._request_times.popleft()
+
+    def has_budget(self) -> bool:
+        """Return True if another request fits in the current rate right away."""
+        self._trim(time())
+        return len(self._request_times) < int(self.rate)
+
+    async def async_acquire(self) -> None:
+        """Wait until another request fits in the current rate."""
+        while True:
+            now = time()
+            self._trim(now)
+            if len(self._request_times) < int(self.rate):
+                self._request_times.append(now)
+                return
+            wait = self._request_times[0] + 60 - now
+            _LOGGER.debug(f"Rate budget of {int(self.rate)}/min used, waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+    @callback
+    def record(self, label: str, elapsed: float, error: TornError | None) -> None:
+        """Adjust the rate after a request (used as a client request hook)."""
+        if isinstance(error, TornRateLimitError):
+            self.rate_limit_errors += 1
+            self._successes = 0
+            now = time()
+            # Errors from requests that were already in flight count as one signal
+            if self.last_decrease is not None and now - self.last_decrease < THROTTLE_DECREASE_COOLDOWN:
+                return
+            self.last_decrease = now
+            self._set_rate(max(THROTTLE_MIN_RATE, self.rate * THROTTLE_DECREASE_FACTOR))
+            return
+
+        if error is not None:
+            return
+
+        self._successes += 1
+        if self._successes >= THROTTLE_INCREASE_AFTER and self.rate < self.max_rate:
+            self._successes = 0
+            self._set_rate(min(self.max_rate, self.rate + THROTTLE_INCREASE_STEP))
+
+    @callback
+    def _set_rate(self, rate: float) -> None:
+        """Apply a new rate and notify listeners."""
+        if rate == self.rate:
+            return
+        _LOGGER.debug(f"Adjusting request rate from {self.rate:.0f} to {rate:.0f}/min")
+        self.rate = rate
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call a listener when the rate changes; return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
@@ -0,0 +1,147 @@
+"""Structured tracing of update cycles for Torn City integration."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+import json
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
+import random
+from time import perf_counter, time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import TRACE_BACKUP_COUNT, TRACE_FILENAME, TRACE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+# Trace of the update cycle running in the current task (None when not sampled).
+# Tasks created during the cycle, such as endpoint requests, inherit it.
+_current_trace: ContextVar[TornTrace | None] = ContextVar("torn_trace", default=None)
+
+
+class TornTrace:
+    """Timed spans of one sampled tier update."""
+
+    __slots__ = ("tier", "entry_id", "started", "wall_time", "spans")
+
+    def __init__(self, tier: str, entry_id: str | None, waited: float = 0.0) -> None:
+        """Start a trace, backdated by the time the cycle waited to be scheduled."""
+        self.tier = tier
+        self.entry_id = entry_id
+        self.started = perf_counter() - waited
+        self.wall_time = time() - waited
+        self.spans: list[tuple[str, str | None, float, float]] = []
+        if waited:
+            self.add("scheduling_wait", None, self.started, waited)
+
+    def add(self, name: str, key: str | None, started: float, duration: float) -> None:
+        """Record a finished span."""
+        self.spans.append((name, key, started, duration))
+
+    def to_record(self) -> dict[str, Any]:
+        """Return the trace as one JSON-serializable record."""
+        return {
+            "ts": round(self.wall_time, 3),
+            "entry_id": self.entry_id,
+            "tier": self.tier,
+            "duration_ms": round((perf_counter() - self.started) * 1000, 3),
+            "spans": [
+                {
+                    "name": name,
+                    "key": key,
+                    "start_ms": round((started - self.started) * 1000, 3),
+                    "duration_ms": round(duration * 1000, 3),
+                }
+                for name, key, started, duration in self.spans
+            ],
+        }
+
+
+@contextmanager
+def span(name: str, key: str | None = None) -> Iterator[None]:
+    """Time the block as a span of the current trace, if any."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, key, started, perf_counter() - started)
+
+
+def activate(trace: TornTrace | None) -> Token[TornTrace | None]:
+    """Make a trace current for this task and the tasks it creates."""
+    return _current_trace.set(trace)
+
+
+def deactivate(token: Token[TornTrace | None]) -> None:
+    """Restore the trace that was current before activate."""
+    _current_trace.reset(token)
+
+
+class TornTracer:
+    """Rotating JSONL trace file shared by all config entries.
+
+    Records are handed to a queue on the event loop; a listener thread
+    writes them, so file I/O never blocks the loop. Only a sample of the
+    cycles is traced.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracer."""
+        self.hass = hass
+        self.path = hass.config.path(TRACE_FILENAME)
+        self._queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._listener: QueueListener | None = None
+        self._logger = logging.getLogger(f"{__name__}.writer")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+
+    async def async_start(self) -> None:
+        """Open the trace file and start the writer thread (only once)."""
+        if self._listener is None:
+            await self.hass.async_add_executor_job(self._start)
+
+    def _start(self) -> None:
+        """Open the file and start the writer thread (executor)."""
+        handler = RotatingFileHandler(
+            self.path, maxBytes=TRACE_MAX_BYTES, backupCount=TRACE_BACKUP_COUNT, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._listener = QueueListener(self._queue, handler)
+        self._listener.start()
+        self._logger.addHandler(QueueHandler(self._queue))
+        _LOGGER.debug(f"Writing traces to {self.path}")
+
+    async def async_stop(self) -> None:
+        """Flush pending records and close the trace file."""
+        await self.hass.async_add_executor_job(self._stop)
+
+    def _stop(self) -> None:
+        """Stop the writer thread and close the file (executor)."""
+        if self._listener is None:
+            return
+        for handler in list(self._logger.handlers):
+            self._logger.removeHandler(handler)
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+
+    def start_trace(
+        self, tier: str, entry_id: str | None, sample_rate: float, waited: float = 0.0
+    ) -> TornTrace | None:
+        """Return a new trace for a cycle, or None when the cycle is not sampled."""
+        if self._listener is None or random.random() >= sample_rate:
+            return None
+        return TornTrace(tier, entry_id, waited)
+
+    def write(self, trace: TornTrace) -> None:
+        """Queue a finished trace for writing."""
+        self._logger.info(json.dumps(trace.to_record(), separators=(",", ":")))